@@ -0,0 +1,6 @@
+"""
+Utilidades compartidas de carga y análisis para los entregables del diplomado.
+
+Los módulos de este paquete se importan desde ``desafio_analisis_estudiantes/app.py``
+y ``proyecto_ventas/analisis_ventas.py``.
+"""
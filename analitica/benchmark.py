@@ -0,0 +1,202 @@
+"""
+Benchmark de las etapas del análisis sobre datos sintéticos.
+
+Genera (o reutiliza) CSV sintéticos de estudiantes y ventas del tamaño pedido,
+mide el tiempo de pared y el pico de memoria residente de cada etapa y compara
+el resultado con una línea base guardada. Se ejecuta sin navegador:
+
+    python -m analitica.benchmark --tamanos 20k 1M --guardar-linea-base
+    python -m analitica.benchmark --tamanos 20k 1M --tolerancia 0.2
+
+Termina con código 1 si alguna etapa empeoró más que la tolerancia.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+# Sin pantalla: las figuras se dibujan con el backend Agg
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import pandas as pd
+
+from analitica.cache import cache_datasets
+from analitica.calculos import ESTADISTICAS, calculo, medir_importacion
+from analitica.densidad import RESOLUCION, UMBRAL_FILAS_DENSIDAD
+from analitica.estudiantes import (
+    TIPOS_ARROW, cargar_estudiantes, obtener_cubo, obtener_escalado, ruta_cubo, ruta_escalado,
+)
+from analitica.figuras import renderizar
+from analitica.graficos import dibujar_barras_comuna, dibujar_dispersion, dibujar_histogramas
+from analitica.perfilado import MedidorMemoria
+from analitica.sinteticos import generar_estudiantes, generar_ventas
+from analitica.snapshot import convertir_csv, ruta_snapshot
+from analitica.ventas import acumular_ventas
+
+TAMANOS = {"20k": 20_000, "1M": 1_000_000, "10M": 10_000_000, "50M": 50_000_000}
+
+RUTA_LINEA_BASE = "benchmarks/linea_base.json"
+
+# Margen relativo por defecto antes de considerar que una etapa empeoró
+TOLERANCIA = 0.2
+
+# Holguras absolutas para que el ruido de mediciones pequeñas no cuente como regresión
+HOLGURA_SEGUNDOS = 0.05
+HOLGURA_MEMORIA_MB = 10
+
+
+def _figura(dibujar, **parametros):
+    return lambda rutas: renderizar(dibujar(rutas["estudiantes"], **parametros))
+
+
+def _grafico_ventas(rutas):
+    from proyecto_ventas.analisis_ventas import dibujar_precio_total_streaming
+    return renderizar(dibujar_precio_total_streaming(rutas["ventas"], top=10))
+
+
+# Etapas en orden de ejecución: (nombre, función que recibe {"estudiantes", "ventas"})
+ETAPAS = [
+    ("instantanea", lambda rutas: convertir_csv(rutas["estudiantes"], TIPOS_ARROW)),
+    ("carga", lambda rutas: cargar_estudiantes(rutas["estudiantes"])),
+    ("cubo", lambda rutas: obtener_cubo(rutas["estudiantes"])),
+    ("escalado", lambda rutas: obtener_escalado(rutas["estudiantes"])),
+] + [
+    (f"estadistica:{clave}", lambda rutas, clave=clave: calculo(clave)(rutas["estudiantes"]))
+    for clave in ESTADISTICAS
+] + [
+    ("grafico:histogramas", _figura(dibujar_histogramas, bins=50)),
+    ("grafico:barras_comuna", _figura(dibujar_barras_comuna)),
+    ("grafico:dispersion", _figura(dibujar_dispersion, umbral_densidad=UMBRAL_FILAS_DENSIDAD, resolucion=RESOLUCION)),
+    ("ventas:acumular", lambda rutas: acumular_ventas(rutas["ventas"])),
+    ("ventas:grafico", _grafico_ventas),
+]
+
+
+def preparar_datos(directorio, tamano, semilla=0):
+    """
+    Genera los CSV sintéticos de `tamano` en `directorio` si no existen y elimina
+    los derivados de ejecuciones anteriores, para que cada etapa parta en frío.
+    """
+    filas = TAMANOS[tamano]
+    os.makedirs(directorio, exist_ok=True)
+    rutas = {
+        "estudiantes": os.path.join(directorio, f"estudiantes_{tamano}_{semilla}.csv"),
+        "ventas": os.path.join(directorio, f"ventas_{tamano}_{semilla}.csv"),
+    }
+    if not os.path.exists(rutas["estudiantes"]):
+        generar_estudiantes(rutas["estudiantes"], filas, semilla)
+    if not os.path.exists(rutas["ventas"]):
+        generar_ventas(rutas["ventas"], filas, semilla=semilla)
+
+    for derivado in [ruta_snapshot, ruta_cubo, ruta_escalado]:
+        derivado = derivado(rutas["estudiantes"])
+        if os.path.exists(derivado):
+            os.remove(derivado)
+    return rutas
+
+
+def medir_etapas(rutas, etapas=None):
+    """
+    Ejecuta las etapas (todas por defecto) y devuelve {etapa: {"segundos", "memoria_mb"}}.
+
+    Antes de cada etapa se vacía la caché en memoria; los derivados persistidos
+    por etapas anteriores (instantánea, cubo) sí se reutilizan, como en la app.
+    """
+    resultados = {}
+    for nombre, funcion in ETAPAS:
+        if etapas and nombre not in etapas:
+            continue
+        cache_datasets.limpiar()
+        gc.collect()
+        with MedidorMemoria() as memoria:
+            inicio = time.perf_counter()
+            funcion(rutas)
+            segundos = time.perf_counter() - inicio
+        resultados[nombre] = {"segundos": round(segundos, 4), "memoria_mb": round(memoria.delta_mb, 1)}
+    return resultados
+
+
+def comparar(resultados, linea_base, tolerancia=TOLERANCIA):
+    """
+    Devuelve las regresiones respecto de la línea base como una lista de
+    (tamaño, etapa, métrica, base, actual).
+    """
+    holguras = {"segundos": HOLGURA_SEGUNDOS, "memoria_mb": HOLGURA_MEMORIA_MB}
+    regresiones = []
+    for tamano, etapas in resultados.items():
+        for etapa, metricas in etapas.items():
+            base = linea_base.get(tamano, {}).get(etapa)
+            if base is None:
+                continue
+            for metrica, holgura in holguras.items():
+                if metricas[metrica] > base[metrica] * (1 + tolerancia) + holgura:
+                    regresiones.append((tamano, etapa, metrica, base[metrica], metricas[metrica]))
+    return regresiones
+
+
+def leer_linea_base(ruta):
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)["resultados"]
+
+
+def guardar_linea_base(ruta, resultados):
+    # Se conservan los tamaños que no se midieron en esta ejecución
+    combinados = {**leer_linea_base(ruta), **resultados}
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    contenido = {
+        "maquina": {"sistema": platform.platform(), "python": platform.python_version(), "nucleos": os.cpu_count()},
+        "resultados": combinados,
+    }
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(contenido, archivo, ensure_ascii=False, indent=2)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark de las etapas del análisis sobre datos sintéticos.")
+    parser.add_argument('--tamanos', nargs='+', choices=list(TAMANOS), default=["20k"])
+    parser.add_argument('--etapas', nargs='+', choices=[nombre for nombre, _ in ETAPAS], default=None,
+                        help="etapas a medir (por defecto, todas)")
+    parser.add_argument('--directorio', default="benchmarks/datos", help="directorio de los CSV sintéticos")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--linea-base', default=RUTA_LINEA_BASE)
+    parser.add_argument('--guardar-linea-base', action='store_true',
+                        help="guardar los resultados como nueva línea base en lugar de comparar")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help="empeoramiento relativo permitido antes de marcar una regresión")
+    parser.add_argument('--resultados', help="archivo JSON donde escribir los resultados de esta ejecución")
+    args = parser.parse_args(argumentos)
+
+    resultados = {}
+    importacion = medir_importacion()
+    print(f"Importación del núcleo de cálculo: {importacion['segundos']:.3f} s "
+          f"(módulos pesados: {', '.join(importacion['modulos_pesados']) or 'ninguno'})")
+    for tamano in args.tamanos:
+        rutas = preparar_datos(args.directorio, tamano, args.semilla)
+        resultados[tamano] = medir_etapas(rutas, args.etapas)
+        print(f"\n{tamano} filas:")
+        print(pd.DataFrame(resultados[tamano]).T.to_string())
+
+    if args.resultados:
+        with open(args.resultados, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+
+    if args.guardar_linea_base:
+        guardar_linea_base(args.linea_base, resultados)
+        print(f"\nLínea base guardada en {args.linea_base}")
+        return 0
+
+    regresiones = comparar(resultados, leer_linea_base(args.linea_base), args.tolerancia)
+    for tamano, etapa, metrica, base, actual in regresiones:
+        print(f"REGRESIÓN {tamano} {etapa} {metrica}: {base} -> {actual}")
+    if not regresiones:
+        print("\nSin regresiones respecto de la línea base.")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Bosquejos (sketches) combinables para estadísticas aproximadas a gran escala.
+
+- `BosquejoCuantiles`: bosquejo de cuantiles tipo KLL. Guarda una jerarquía de
+  compactadores; cada compactación ordena un nivel y promueve la mitad de sus
+  elementos (con desplazamiento aleatorio) al nivel siguiente con el doble de peso.
+  La memoria es O(k log(n / k)) y el error de rango normalizado es ~1.3 % con k=200.
+- `BosquejoFrecuencias`: resumen de Misra-Gries con a lo sumo `k` contadores. Cada
+  conteo estimado es una cota inferior del real y el error está acotado por la
+  suma de los descuentos aplicados (como máximo n / (k + 1)).
+
+Ambos se actualizan por bloques y se combinan entre bloques o fragmentos, por lo
+que permiten resumir datasets que no caben en memoria.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+# Parámetro de precisión por defecto de los bosquejos
+K_POR_DEFECTO = int(os.environ.get("ANALITICA_BOSQUEJO_K", "200"))
+
+# Cuantiles que muestra df.describe()
+CUANTILES_DESCRIBE = [0.25, 0.5, 0.75]
+
+
+def error_rango_kll(k):
+    """
+    Error de rango normalizado aproximado (99 % de confianza) de un bosquejo KLL
+    con parámetro `k`, según la aproximación empírica de Apache DataSketches.
+    """
+    return 2.296 / k ** 0.9723
+
+
+class BosquejoCuantiles:
+    """
+    Bosquejo de cuantiles tipo KLL con estadísticos exactos de conteo, suma,
+    suma de cuadrados de las desviaciones (M2), mínimo y máximo.
+    """
+
+    def __init__(self, k=K_POR_DEFECTO, semilla=0):
+        self.k = k
+        self._rng = np.random.default_rng(semilla)
+        self.niveles = [np.empty(0)]
+        self.n = 0
+        self.suma = 0.0
+        self.m2 = 0.0
+        self.minimo = np.inf
+        self.maximo = -np.inf
+
+    def _capacidad(self, nivel):
+        # Los niveles inferiores tienen menos capacidad (factor 2/3 por nivel), como en KLL
+        altura = len(self.niveles) - nivel - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** altura)))
+
+    def _agregar_momentos(self, n, suma, m2):
+        # Combinación de M2 por bloques (Chan et al.), como en EstadisticasEscalado;
+        # con la suma de cuadrados cruda la varianza pierde precisión si la media es grande
+        if self.n:
+            delta = suma / n - self.suma / self.n
+            m2 += delta ** 2 * self.n * n / (self.n + n)
+        self.n += n
+        self.suma += suma
+        self.m2 += m2
+
+    def _compactar(self):
+        nivel = 0
+        while nivel < len(self.niveles):
+            if len(self.niveles[nivel]) > self._capacidad(nivel):
+                if nivel + 1 == len(self.niveles):
+                    self.niveles.append(np.empty(0))
+                valores = np.sort(self.niveles[nivel])
+                # Con una cantidad impar se deja un elemento en el nivel actual
+                resto = valores[-1:] if len(valores) % 2 else valores[:0]
+                pares = valores[:len(valores) - len(resto)]
+                promovidos = pares[self._rng.integers(2)::2]
+                self.niveles[nivel] = resto
+                self.niveles[nivel + 1] = np.concatenate([self.niveles[nivel + 1], promovidos])
+            nivel += 1
+
+    def actualizar(self, valores):
+        """
+        Agrega un bloque de valores al bosquejo.
+        """
+        valores = np.asarray(valores, dtype=np.float64)
+        valores = valores[~np.isnan(valores)]
+        if not len(valores):
+            return self
+        suma = float(valores.sum())
+        self._agregar_momentos(len(valores), suma, float(((valores - suma / len(valores)) ** 2).sum()))
+        self.minimo = min(self.minimo, float(valores.min()))
+        self.maximo = max(self.maximo, float(valores.max()))
+        # Los bloques grandes se ingresan por partes para que la memoria siga acotada
+        for inicio in range(0, len(valores), self.k):
+            self.niveles[0] = np.concatenate([self.niveles[0], valores[inicio:inicio + self.k]])
+            self._compactar()
+        return self
+
+    def combinar(self, otro):
+        """
+        Devuelve un bosquejo que resume la unión de los datos de ambos.
+        """
+        combinado = BosquejoCuantiles(self.k, semilla=int(self._rng.integers(2 ** 31)))
+        altura = max(len(self.niveles), len(otro.niveles))
+        combinado.niveles = [
+            np.concatenate([
+                self.niveles[i] if i < len(self.niveles) else np.empty(0),
+                otro.niveles[i] if i < len(otro.niveles) else np.empty(0),
+            ])
+            for i in range(altura)
+        ]
+        for bosquejo in (self, otro):
+            if bosquejo.n:
+                combinado._agregar_momentos(bosquejo.n, bosquejo.suma, bosquejo.m2)
+        combinado.minimo = min(self.minimo, otro.minimo)
+        combinado.maximo = max(self.maximo, otro.maximo)
+        combinado._compactar()
+        return combinado
+
+    def cuantiles(self, qs):
+        """
+        Estima los cuantiles `qs` (entre 0 y 1).
+        """
+        if not self.n:
+            return np.full(len(qs), np.nan)
+        valores = np.concatenate(self.niveles)
+        pesos = np.concatenate([np.full(len(nivel), 2 ** i) for i, nivel in enumerate(self.niveles)])
+        orden = np.argsort(valores, kind="stable")
+        valores, acumulado = valores[orden], np.cumsum(pesos[orden])
+        posiciones = np.searchsorted(acumulado, np.asarray(qs) * acumulado[-1], side="left")
+        return valores[np.clip(posiciones, 0, len(valores) - 1)]
+
+    @property
+    def error_rango(self):
+        return error_rango_kll(self.k)
+
+    def tamano_en_memoria(self):
+        return int(sum(nivel.nbytes for nivel in self.niveles))
+
+
+class BosquejoFrecuencias:
+    """
+    Resumen de frecuencias de Misra-Gries con a lo sumo `k` contadores.
+    """
+
+    def __init__(self, k=K_POR_DEFECTO):
+        self.k = k
+        self.conteos = pd.Series(dtype=np.int64)
+        self.n = 0
+        # Suma de los descuentos aplicados: cota del error de cada conteo
+        self.error = 0
+
+    def _recortar(self):
+        if len(self.conteos) > self.k:
+            descuento = int(self.conteos.nlargest(self.k + 1).iloc[-1])
+            self.conteos = self.conteos - descuento
+            self.conteos = self.conteos[self.conteos > 0]
+            self.error += descuento
+
+    def actualizar(self, valores):
+        """
+        Agrega un bloque de valores (se cuentan exactamente y luego se combinan).
+        """
+        serie = pd.Series(valores).dropna()
+        self.n += len(serie)
+        self.conteos = self.conteos.add(serie.value_counts(), fill_value=0).astype(np.int64)
+        self._recortar()
+        return self
+
+    def combinar(self, otro):
+        combinado = BosquejoFrecuencias(self.k)
+        combinado.conteos = self.conteos.add(otro.conteos, fill_value=0).astype(np.int64)
+        combinado.n = self.n + otro.n
+        combinado.error = self.error + otro.error
+        combinado._recortar()
+        return combinado
+
+    def frecuentes(self):
+        """
+        Conteos estimados (cotas inferiores), ordenados por valor, y la cota superior
+        de cada uno.
+        """
+        conteos = self.conteos.sort_index()
+        return pd.DataFrame({"count": conteos, "cota superior": conteos + self.error})
+
+    def tamano_en_memoria(self):
+        return int(self.conteos.memory_usage(deep=True))
+
+
+class ResumenAproximado:
+    """
+    Bosquejos de cuantiles por columna numérica y de frecuencias por columna elegida.
+    """
+
+    def __init__(self, cuantiles, frecuencias):
+        self.cuantiles = cuantiles
+        self.frecuencias = frecuencias
+
+    @classmethod
+    def desde_bloque(cls, df, columnas, columnas_frecuencia=(), k=K_POR_DEFECTO):
+        cuantiles = {c: BosquejoCuantiles(k).actualizar(df[c].to_numpy()) for c in columnas}
+        frecuencias = {c: BosquejoFrecuencias(k).actualizar(df[c]) for c in columnas_frecuencia}
+        return cls(cuantiles, frecuencias)
+
+    def combinar(self, otro):
+        return ResumenAproximado(
+            {c: b.combinar(otro.cuantiles[c]) for c, b in self.cuantiles.items()},
+            {c: b.combinar(otro.frecuencias[c]) for c, b in self.frecuencias.items()},
+        )
+
+    def describir(self):
+        """
+        Tabla con el formato de `df.describe()` más el error de rango de los
+        cuantiles. Conteo, media, desviación, mínimo y máximo son exactos.
+        """
+        filas = {}
+        for columna, b in self.cuantiles.items():
+            media = b.suma / b.n if b.n else np.nan
+            varianza = b.m2 / (b.n - 1) if b.n > 1 else np.nan
+            cuartiles = b.cuantiles(CUANTILES_DESCRIBE)
+            filas[columna] = [
+                b.n, media, np.sqrt(varianza), b.minimo, *cuartiles, b.maximo,
+                b.error_rango * 100,
+            ]
+        indice = ["count", "mean", "std", "min", "25%", "50%", "75%", "max", "± error de rango (%)"]
+        return pd.DataFrame(filas, index=indice)
+
+    def tamano_en_memoria(self):
+        bosquejos = list(self.cuantiles.values()) + list(self.frecuencias.values())
+        return sum(b.tamano_en_memoria() for b in bosquejos)
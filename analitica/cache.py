@@ -0,0 +1,146 @@
+"""
+Caché de datasets compartida entre sesiones.
+
+Cada entrada se identifica por la versión del archivo de origen (ruta, fecha de
+modificación y tamaño), de modo que un cambio en el archivo invalida la entrada
+automáticamente. La memoria total se acota desalojando las entradas usadas hace
+más tiempo (LRU).
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+# Límite por defecto de la caché en megabytes (configurable por variable de entorno)
+LIMITE_MB_POR_DEFECTO = int(os.environ.get("ANALITICA_CACHE_MB", "512"))
+
+
+def version_archivo(ruta):
+    """
+    Devuelve la versión de un archivo como tupla (ruta absoluta, mtime en ns, tamaño).
+
+    Si `ruta` es una lista de archivos (por ejemplo, fragmentos de un mismo dataset)
+    se devuelve la tupla de sus versiones.
+    """
+    if isinstance(ruta, (list, tuple)):
+        return tuple(version_archivo(r) for r in ruta)
+    ruta = os.path.abspath(ruta)
+    info = os.stat(ruta)
+    return (ruta, info.st_mtime_ns, info.st_size)
+
+
+def identidad_archivo(ruta):
+    """
+    Ruta absoluta de un archivo, o tupla de rutas si `ruta` es una lista.
+    """
+    if isinstance(ruta, (list, tuple)):
+        return tuple(os.path.abspath(r) for r in ruta)
+    return os.path.abspath(ruta)
+
+
+def tamano_en_memoria(objeto):
+    """
+    Estima los bytes que ocupa un objeto cacheado.
+    """
+    if hasattr(objeto, "memory_usage"):
+        # DataFrame / Series de pandas
+        uso = objeto.memory_usage(deep=True)
+        return int(uso.sum()) if hasattr(uso, "sum") else int(uso)
+    if hasattr(objeto, "nbytes"):
+        # Arreglos de NumPy / tablas de Arrow
+        return int(objeto.nbytes)
+    if hasattr(objeto, "tamano_en_memoria"):
+        return int(objeto.tamano_en_memoria())
+    return sys.getsizeof(objeto)
+
+
+class CacheDatasets:
+    """
+    Caché LRU de objetos derivados de archivos, acotada en bytes.
+
+    La clave de cada entrada es la versión del archivo más una variante opcional
+    (por ejemplo, el subconjunto de columnas leídas).
+    """
+
+    def __init__(self, limite_bytes=LIMITE_MB_POR_DEFECTO * 1024 * 1024):
+        self.limite_bytes = limite_bytes
+        self._entradas = OrderedDict()  # clave -> (objeto, bytes)
+        self._bytes_usados = 0
+        self._lock = threading.RLock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, ruta, cargador, variante=None):
+        """
+        Devuelve el objeto cacheado para la versión actual de `ruta`, cargándolo con
+        `cargador(ruta)` si no está en la caché o si el archivo cambió. `ruta` puede
+        ser un archivo o una lista de archivos.
+        """
+        identidad = identidad_archivo(ruta)
+        version = version_archivo(ruta)
+        clave = (identidad, version, variante)
+
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return self._entradas[clave][0]
+            self.fallos += 1
+            # Las versiones anteriores del mismo archivo ya no son válidas
+            self._invalidar_obsoletas(identidad, version)
+
+        # La carga se hace fuera del lock para no bloquear otras sesiones
+        objeto = cargador(ruta)
+        tamano = tamano_en_memoria(objeto)
+
+        with self._lock:
+            if clave not in self._entradas:
+                self._entradas[clave] = (objeto, tamano)
+                self._bytes_usados += tamano
+            self._entradas.move_to_end(clave)
+            self._desalojar()
+            return self._entradas[clave][0] if clave in self._entradas else objeto
+
+    def _invalidar_obsoletas(self, identidad, version):
+        obsoletas = [c for c in self._entradas if c[0] == identidad and c[1] != version]
+        for clave in obsoletas:
+            self._eliminar(clave)
+
+    def _desalojar(self):
+        # Se conserva siempre la entrada más reciente, aunque supere el límite por sí sola
+        while self._bytes_usados > self.limite_bytes and len(self._entradas) > 1:
+            clave = next(iter(self._entradas))
+            self._eliminar(clave)
+            self.desalojos += 1
+
+    def _eliminar(self, clave):
+        _, tamano = self._entradas.pop(clave)
+        self._bytes_usados -= tamano
+
+    def limpiar(self):
+        """
+        Elimina todas las entradas y reinicia los contadores.
+        """
+        with self._lock:
+            self._entradas.clear()
+            self._bytes_usados = 0
+            self.aciertos = self.fallos = self.desalojos = 0
+
+    def estadisticas(self):
+        """
+        Devuelve los contadores de la caché en un diccionario.
+        """
+        with self._lock:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "entradas": len(self._entradas),
+                "bytes_usados": self._bytes_usados,
+                "limite_bytes": self.limite_bytes,
+            }
+
+
+# Instancia única compartida por todas las sesiones del proceso
+cache_datasets = CacheDatasets()
@@ -0,0 +1,249 @@
+"""
+Núcleo de cálculo del análisis de estudiantes, sin streamlit ni gráficos.
+
+Contiene los cálculos de cada sección del tablero y una línea de comandos que
+exporta las estadísticas a JSON o Parquet, para reutilizarlas en procesos por
+lotes o notebooks sin pagar la importación de streamlit ni de matplotlib:
+
+    python -m analitica.calculos [CSV ...] --formato json --salida estadisticas.json
+    python -m analitica.calculos --medir-importacion
+    python -m analitica.calculos --one-hot genero.parquet   (o .npz, empaquetada en bits)
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from analitica.codificacion import OneHotCategorico, tabla_codigos
+from analitica.estudiantes import (
+    COLUMNAS_ESCALADO, NOTAS, RUTA_DATOS, cargar_estudiantes, obtener_cubo, obtener_escalado, obtener_explorador,
+    obtener_indice, reporte_memoria,
+)
+
+# Módulos cuya importación es costosa y que el núcleo de cálculo no debe cargar
+MODULOS_PESADOS = ["streamlit", "matplotlib", "seaborn", "sklearn"]
+
+
+def calcular_info(ruta):
+    df = cargar_estudiantes(ruta)
+
+    # Crear un DataFrame con la información de df.info()
+    info_data = {
+        "Columna": df.columns,
+        "Tipo de datos": df.dtypes.astype(str),
+        "No Nulos": df.notnull().sum(),
+        "Total": df.shape[0]
+    }
+    return pd.DataFrame(info_data), reporte_memoria(df)
+
+
+def calcular_nulos(ruta):
+    # Calcular valores nulos por columna
+    valores_nulos = cargar_estudiantes(ruta).isnull().sum()
+    valores_nulos.index.name = "Nombre_Columna"  # Renombrar el índice
+    return valores_nulos.rename("Nulos")  # Renombrar la columna de valores nulos
+
+
+def calcular_promedio_estudiante(ruta):
+    df = cargar_estudiantes(ruta, ['Estudiante_ID'] + NOTAS)
+    df['Promedio'] = df[NOTAS].mean(axis=1)
+    return df
+
+
+def calcular_promedio_alto(ruta, umbral=80):
+    # Estudiantes con promedio mayor que `umbral`, desde el índice ordenado
+    indice = obtener_indice(ruta)
+    posiciones = indice.posiciones('Promedio', umbral, incluir_minimo=False)
+    return indice.primeras_filas(posiciones)[['Estudiante_ID', 'Promedio']], len(posiciones)
+
+
+def calcular_normalizacion(ruta):
+    df = cargar_estudiantes(ruta, COLUMNAS_ESCALADO)
+
+    # Normalizar las columnas con las estadísticas acumuladas (sin volver a ajustar);
+    # las columnas normalizadas se generan en float32 en un DataFrame aparte
+    normalizadas = obtener_escalado(ruta).transformar(df, COLUMNAS_ESCALADO)
+    return normalizadas.describe()
+
+
+def calcular_one_hot(ruta):
+    # Sólo se cargan la columna 'Genero' (un código de 1 byte por fila) y las filas mostradas
+    genero = cargar_estudiantes(ruta, ['Genero'])['Genero']
+    primeras_filas = obtener_explorador(ruta).pagina(0, 5)
+
+    # Realizar One-Hot Encoding sobre los códigos de la categoría; las columnas densas
+    # sólo se generan para las filas que se muestran
+    df_genero_encoded = OneHotCategorico(genero, prefijo='Genero').densa(slice(0, 5))
+
+    # Concatenar las primeras filas del DataFrame original con las nuevas columnas
+    df_with_encoded_genero = pd.concat([primeras_filas, df_genero_encoded], axis=1)
+
+    # Tabla de códigos ordinales de 'Comuna', desde sus categorías
+    codigos_comuna = tabla_codigos(cargar_estudiantes(ruta, ['Comuna'])['Comuna'])
+    return df_with_encoded_genero, codigos_comuna
+
+
+# Estadísticas exportables: clave -> (título de la sección, cálculo, nombres de las partes
+# cuando el cálculo devuelve varias tablas)
+ESTADISTICAS = {
+    "primeras_filas": ('Primeras filas del conjunto de datos', lambda ruta: cargar_estudiantes(ruta).head(), None),
+    "ultimas_filas": ('Últimas filas del conjunto de datos', lambda ruta: cargar_estudiantes(ruta).tail(), None),
+    "dimensiones": ('Dimensiones del conjunto de datos', lambda ruta: cargar_estudiantes(ruta).shape, None),
+    "describe": ('Estadísticas descriptivas', lambda ruta: cargar_estudiantes(ruta).describe(), None),
+    "info": ('Información adicional', calcular_info, ["columnas", "memoria"]),
+    "nulos": ("Verificar valores nulos", calcular_nulos, None),
+    "edades": ('Rango de edad más común entre los estudiantes', lambda ruta: obtener_cubo(ruta).conteo('Edad'), None),
+    "promedio_asignaturas": ('Promedio por asignatura', lambda ruta: obtener_cubo(ruta).promedios().rename("Promedio"), None),
+    "promedio_estudiante": ('Promedio por estudiante', lambda ruta: calcular_promedio_estudiante(ruta).head(), None),
+    "porcentaje_aprobados": ('Porcentaje de estudiantes con calificación >= 60', lambda ruta: obtener_cubo(ruta).porcentaje_aprobados(), None),
+    "matematicas_por_comuna": ('Comuna con el promedio más alto en matemáticas', lambda ruta: obtener_cubo(ruta).promedios('Comuna')['Nota_Matemáticas'], None),
+    "promedio_mayor_80": ("Estudiantes con calificaciones promedio > 80", calcular_promedio_alto, ["primeras_filas", "total"]),
+    "promedio_genero": ("Promedio de calificaciones por género", lambda ruta: obtener_cubo(ruta).promedios('Genero'), None),
+    "normalizacion": ("Normalizar columnas de calificaciones y horas de estudio", calcular_normalizacion, None),
+    "one_hot": ("Convertir categorías de la columna 'Genero' en variables numéricas (One-Hot Encoding)", calcular_one_hot, ["primeras_filas", "codigos_comuna"]),
+}
+
+
+def calculo(clave):
+    """
+    Devuelve la función de cálculo de la estadística `clave`.
+    """
+    return ESTADISTICAS[clave][1]
+
+
+def a_tabla(valor):
+    """
+    Convierte el resultado de un cálculo (DataFrame, Series, tupla o escalar) en un DataFrame.
+    """
+    if isinstance(valor, pd.DataFrame):
+        return valor
+    if isinstance(valor, pd.Series):
+        return valor.to_frame()
+    if isinstance(valor, tuple):
+        return pd.DataFrame({"valor": list(valor)})
+    return pd.DataFrame({"valor": [valor]})
+
+
+def calcular_estadisticas(ruta=RUTA_DATOS, claves=None):
+    """
+    Calcula las estadísticas pedidas (todas por defecto) y devuelve
+    {clave: {nombre de tabla: DataFrame}}.
+    """
+    resultados = {}
+    for clave in claves or ESTADISTICAS:
+        _, calcular, partes = ESTADISTICAS[clave]
+        valor = calcular(ruta)
+        if partes:
+            resultados[clave] = {parte: a_tabla(v) for parte, v in zip(partes, valor)}
+        else:
+            resultados[clave] = {clave: a_tabla(valor)}
+    return resultados
+
+
+def exportar_json(resultados, destino=None):
+    # Sin `destino` se escribe por la salida estándar
+    contenido = {
+        clave: {
+            "titulo": ESTADISTICAS[clave][0],
+            "tablas": {nombre: json.loads(tabla.to_json(orient="split", force_ascii=False)) for nombre, tabla in tablas.items()},
+        }
+        for clave, tablas in resultados.items()
+    }
+    if destino is None:
+        json.dump(contenido, sys.stdout, ensure_ascii=False, indent=2)
+        return
+    with open(destino, "w", encoding="utf-8") as archivo:
+        json.dump(contenido, archivo, ensure_ascii=False, indent=2)
+
+
+def exportar_parquet(resultados, destino):
+    # Un archivo por tabla dentro del directorio `destino`
+    os.makedirs(destino, exist_ok=True)
+    for clave, tablas in resultados.items():
+        for nombre, tabla in tablas.items():
+            archivo = clave if nombre == clave else f"{clave}.{nombre}"
+            tabla = tabla.copy()
+            tabla.columns = [str(columna) for columna in tabla.columns]
+            tabla.to_parquet(os.path.join(destino, archivo + ".parquet"))
+
+
+def exportar_one_hot(ruta, destino, columna="Genero"):
+    """
+    Exporta la codificación one-hot completa de `columna`. Con extensión `.npz` se
+    guarda empaquetada en bits (una fila de bits por categoría); si no, como Parquet
+    escrito por bloques, de modo que las columnas densas nunca están completas en memoria.
+    """
+    one_hot = OneHotCategorico(cargar_estudiantes(ruta, [columna])[columna])
+    if destino.endswith(".npz"):
+        np.savez(destino, bits=one_hot.empaquetada(), filas=len(one_hot), categorias=np.array(one_hot.categorias, dtype=str))
+        return
+    escritor = None
+    try:
+        for bloque in one_hot.iterar_bloques():
+            tabla = pa.Table.from_pandas(bloque, preserve_index=False)
+            if escritor is None:
+                escritor = pq.ParquetWriter(destino, tabla.schema)
+            escritor.write_table(tabla)
+    finally:
+        if escritor is not None:
+            escritor.close()
+
+
+def medir_importacion(modulo="analitica.calculos"):
+    """
+    Mide en un proceso nuevo cuánto tarda en importarse `modulo` y qué módulos
+    pesados (MODULOS_PESADOS) carga. Devuelve {"segundos", "modulos_pesados"}.
+    """
+    codigo = (
+        "import json, sys, time\n"
+        "inicio = time.perf_counter()\n"
+        f"import {modulo}\n"
+        "segundos = time.perf_counter() - inicio\n"
+        f"pesados = [m for m in {MODULOS_PESADOS!r} if m in sys.modules]\n"
+        "print(json.dumps({'segundos': segundos, 'modulos_pesados': pesados}))\n"
+    )
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, capture_output=True, text=True, check=True)
+    return json.loads(salida.stdout)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Exporta las estadísticas del análisis de estudiantes.")
+    parser.add_argument('rutas', nargs='*', default=[RUTA_DATOS],
+                        help="CSV de estudiantes (varios se analizan como fragmentos de un mismo dataset)")
+    parser.add_argument('--formato', choices=['json', 'parquet'], default='json')
+    parser.add_argument('--salida', default=None,
+                        help="archivo JSON o directorio Parquet (por defecto, JSON por la salida estándar)")
+    parser.add_argument('--estadisticas', nargs='+', choices=list(ESTADISTICAS), default=None,
+                        help="estadísticas a calcular (por defecto, todas)")
+    parser.add_argument('--medir-importacion', action='store_true',
+                        help="medir el tiempo de importación del núcleo de cálculo y terminar")
+    parser.add_argument('--one-hot', metavar="DESTINO",
+                        help="exportar el One-Hot de 'Genero' a Parquet (o a .npz empaquetado en bits) y terminar")
+    args = parser.parse_args(argumentos)
+
+    if args.medir_importacion:
+        print(json.dumps(medir_importacion()))
+        return
+
+    ruta = args.rutas[0] if len(args.rutas) == 1 else args.rutas
+    if args.one_hot:
+        exportar_one_hot(ruta, args.one_hot)
+        return
+    resultados = calcular_estadisticas(ruta, args.estadisticas)
+    if args.formato == 'parquet':
+        if not args.salida:
+            parser.error("--formato parquet requiere --salida")
+        exportar_parquet(resultados, args.salida)
+    else:
+        exportar_json(resultados, args.salida)
+
+
+if __name__ == "__main__":
+    main()
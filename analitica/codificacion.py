@@ -0,0 +1,69 @@
+"""
+Codificación de columnas categóricas a partir de sus códigos.
+
+Una columna `category` ya guarda un código de 1 byte por fila; las vistas de este
+módulo trabajan sobre esos códigos y sólo materializan columnas densas para las
+filas que se muestran o exportan, en lugar de copiar el DataFrame completo.
+"""
+import numpy as np
+import pandas as pd
+
+
+class OneHotCategorico:
+    """
+    Vista one-hot de una serie categórica, respaldada por sus códigos.
+    """
+
+    def __init__(self, serie, prefijo=None):
+        self.codigos = serie.cat.codes.to_numpy()
+        self.categorias = serie.cat.categories
+        self.indice = serie.index
+        prefijo = serie.name if prefijo is None else prefijo
+        self.columnas = [f"{prefijo}_{categoria}" for categoria in self.categorias]
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def densa(self, filas=slice(None)):
+        """
+        Columnas booleanas (como `pd.get_dummies`) sólo para las posiciones `filas`
+        (un slice o un arreglo de posiciones).
+        """
+        codigos = self.codigos[filas]
+        valores = codigos[:, None] == np.arange(len(self.categorias))
+        return pd.DataFrame(valores, columns=self.columnas, index=self.indice[filas])
+
+    def empaquetada(self):
+        """
+        Máscara de cada categoría empaquetada en bits: arreglo de forma
+        (categorías, ceil(filas / 8)) en uint8.
+
+        Se empaqueta una categoría a la vez, de modo que la única máscara densa
+        en memoria es la de una fila de la salida.
+        """
+        empaquetada = np.empty((len(self.categorias), (len(self.codigos) + 7) // 8), dtype=np.uint8)
+        for codigo in range(len(self.categorias)):
+            empaquetada[codigo] = np.packbits(self.codigos == codigo)
+        return empaquetada
+
+    def iterar_bloques(self, tamano_bloque=100_000):
+        """
+        Recorre la codificación densa por bloques de filas, para exportarla sin
+        tenerla completa en memoria.
+        """
+        for inicio in range(0, len(self), tamano_bloque):
+            yield self.densa(slice(inicio, inicio + tamano_bloque))
+
+    def tamano_en_memoria(self):
+        return int(self.codigos.nbytes)
+
+
+def tabla_codigos(serie):
+    """
+    Tabla categoría → código ordinal de una serie categórica, leída de sus
+    categorías sin recorrer las filas (el código de cada fila es `serie.cat.codes`).
+    """
+    categorias = serie.cat.categories
+    tabla = pd.Series(np.arange(len(categorias), dtype=serie.cat.codes.dtype), index=categorias, name="Código")
+    tabla.index.name = serie.name
+    return tabla
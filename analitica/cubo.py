@@ -0,0 +1,154 @@
+"""
+Cubo de resumen con estadísticas aditivas por combinación de dimensiones.
+
+Cada celda del cubo guarda el conteo, la suma, la suma de cuadrados y la cantidad
+de valores sobre el umbral de aprobación de cada asignatura. Como todas son sumas,
+cualquier agregación por un subconjunto de dimensiones se obtiene sumando celdas,
+en tiempo proporcional al número de grupos y no al de filas.
+"""
+import numpy as np
+import pandas as pd
+
+from analitica.snapshot import escribir_arrow, leer_arrow
+
+UMBRAL_APROBACION = 60
+
+
+class CuboResumen:
+    """
+    Estadísticas de un conjunto de columnas numéricas agregadas por dimensiones.
+
+    `celdas` es un DataFrame indexado por las dimensiones con las columnas `n`,
+    `suma_<col>`, `suma2_<col>` y `aprobados_<col>` para cada columna resumida.
+    """
+
+    def __init__(self, celdas, columnas, umbral=UMBRAL_APROBACION):
+        self.celdas = celdas
+        self.columnas = list(columnas)
+        self.umbral = umbral
+
+    @property
+    def dimensiones(self):
+        return list(self.celdas.index.names)
+
+    @classmethod
+    def construir(cls, df, dimensiones, columnas, umbral=UMBRAL_APROBACION):
+        """
+        Construye el cubo recorriendo las filas una sola vez.
+
+        Las dimensiones categóricas se agrupan por sus códigos y las enteras por su
+        desplazamiento respecto al mínimo; todas se combinan en un índice de celda
+        plano que alimenta `np.bincount`.
+        """
+        clave = np.zeros(len(df), dtype=np.int64)
+        niveles = []
+        for dimension in dimensiones:
+            serie = df[dimension]
+            if isinstance(serie.dtype, pd.CategoricalDtype):
+                codigos = serie.cat.codes.to_numpy().astype(np.int64)
+                nivel = serie.cat.categories
+            else:
+                valores = serie.to_numpy().astype(np.int64)
+                minimo = int(valores.min()) if len(valores) else 0
+                maximo = int(valores.max()) if len(valores) else -1
+                codigos = valores - minimo
+                nivel = pd.RangeIndex(minimo, maximo + 1)
+            clave = clave * len(nivel) + codigos
+            niveles.append(nivel)
+
+        n_celdas = int(np.prod([len(nivel) for nivel in niveles]))
+        datos = {"n": np.bincount(clave, minlength=n_celdas)}
+        for columna in columnas:
+            valores = df[columna].to_numpy(dtype=np.float64)
+            datos[f"suma_{columna}"] = np.bincount(clave, weights=valores, minlength=n_celdas)
+            datos[f"suma2_{columna}"] = np.bincount(clave, weights=valores * valores, minlength=n_celdas)
+            datos[f"aprobados_{columna}"] = np.bincount(clave, minlength=n_celdas, weights=valores >= umbral)
+
+        indice = pd.MultiIndex.from_product(niveles, names=dimensiones)
+        celdas = pd.DataFrame(datos, index=indice)
+        # Sólo se conservan las combinaciones que aparecen en los datos
+        celdas = celdas[celdas["n"] > 0]
+        return cls(celdas, columnas, umbral)
+
+    @classmethod
+    def combinar(cls, cubos):
+        """
+        Suma celda a celda varios cubos con las mismas dimensiones y columnas, por
+        ejemplo los parciales de distintos fragmentos del dataset.
+        """
+        cubos = list(cubos)
+        primero = cubos[0]
+        celdas = pd.concat([cubo.celdas for cubo in cubos])
+        celdas = celdas.groupby(level=primero.dimensiones, sort=True).sum()
+        return cls(celdas, primero.columnas, primero.umbral)
+
+    def agrupar(self, por=None):
+        """
+        Suma las celdas por las dimensiones indicadas (o todas si `por` es None).
+        """
+        if por is None:
+            return self.celdas.sum().to_frame().T
+        return self.celdas.groupby(level=por, sort=True).sum()
+
+    def _por_columna(self, por, calcular):
+        grupos = self.agrupar(por)
+        resultado = pd.DataFrame({columna: calcular(grupos, columna) for columna in self.columnas})
+        if por is None:
+            return resultado.iloc[0].rename(None)
+        return resultado
+
+    def conteo(self, por=None):
+        """
+        Cantidad de filas por grupo (o total si `por` es None).
+        """
+        if por is None:
+            return int(self.celdas["n"].sum())
+        return self.agrupar(por)["n"].rename("count")
+
+    def promedios(self, por=None):
+        """
+        Promedio de cada columna, por grupo o global.
+        """
+        return self._por_columna(por, lambda g, c: g[f"suma_{c}"] / g["n"])
+
+    def desviaciones(self, por=None):
+        """
+        Desviación estándar muestral de cada columna, por grupo o global.
+        """
+        def desviacion(g, c):
+            varianza = (g[f"suma2_{c}"] - g[f"suma_{c}"] ** 2 / g["n"]) / (g["n"] - 1)
+            return np.sqrt(varianza.clip(lower=0))
+        return self._por_columna(por, desviacion)
+
+    def porcentaje_aprobados(self, por=None):
+        """
+        Porcentaje de filas con valor mayor o igual al umbral, por grupo o global.
+        """
+        return self._por_columna(por, lambda g, c: g[f"aprobados_{c}"] / g["n"] * 100)
+
+    def tamano_en_memoria(self):
+        return int(self.celdas.memory_usage(deep=True).sum())
+
+    def guardar(self, ruta, metadatos=None):
+        """
+        Persiste el cubo como archivo Arrow IPC. `metadatos` permite guardar datos
+        adicionales de texto junto al cubo.
+        """
+        metadatos = dict(metadatos or {})
+        metadatos.update({
+            "umbral": self.umbral,
+            "dimensiones": ",".join(self.dimensiones),
+            "columnas": ",".join(self.columnas),
+        })
+        escribir_arrow(self.celdas.reset_index(), ruta, metadatos)
+
+    @classmethod
+    def leer(cls, ruta):
+        """
+        Lee un cubo guardado con `guardar`. Devuelve (cubo, metadatos).
+        """
+        tabla, metadatos = leer_arrow(ruta)
+        dimensiones = metadatos["dimensiones"].split(",")
+        columnas = metadatos["columnas"].split(",")
+        cubo = cls(tabla.set_index(dimensiones), columnas, float(metadatos["umbral"]))
+        return cubo, metadatos
@@ -0,0 +1,88 @@
+"""
+Gráficos de dispersión por densidad para conjuntos con millones de puntos.
+
+En lugar de dibujar cada punto, se agrupan en una grilla 2D con NumPy y se dibuja
+la grilla, de modo que el costo de dibujo depende de la resolución y no de la
+cantidad de filas. Opcionalmente se superpone una muestra por reservorio de los
+puntos que caen en celdas poco pobladas, para que los atípicos sigan visibles.
+"""
+import os
+
+import numpy as np
+
+# Cantidad de filas a partir de la cual se usa el modo por densidad
+UMBRAL_FILAS_DENSIDAD = int(os.environ.get("ANALITICA_UMBRAL_DENSIDAD", "100000"))
+
+# Celdas por eje de la grilla de densidad
+RESOLUCION = 200
+
+
+class MuestraReservorio:
+    """
+    Muestra aleatoria uniforme de tamaño fijo sobre datos que llegan por lotes.
+
+    Cada punto recibe una prioridad aleatoria y se conservan los `k` de menor
+    prioridad, lo que equivale a un muestreo por reservorio y permite combinar
+    muestras de distintos lotes o fragmentos.
+    """
+
+    def __init__(self, k, semilla=0):
+        self.k = k
+        self._rng = np.random.default_rng(semilla)
+        self.prioridades = np.empty(0)
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+
+    def agregar(self, x, y):
+        prioridades = np.concatenate([self.prioridades, self._rng.random(len(x))])
+        x = np.concatenate([self.x, np.asarray(x, dtype=np.float64)])
+        y = np.concatenate([self.y, np.asarray(y, dtype=np.float64)])
+        if len(prioridades) > self.k:
+            elegidos = np.argpartition(prioridades, self.k)[:self.k]
+            prioridades, x, y = prioridades[elegidos], x[elegidos], y[elegidos]
+        self.prioridades, self.x, self.y = prioridades, x, y
+        return self
+
+
+def grilla_densidad(x, y, resolucion=RESOLUCION):
+    """
+    Cuenta los puntos por celda de una grilla `resolucion` × `resolucion`.
+
+    Devuelve (conteos, bordes_x, bordes_y) como `np.histogram2d`.
+    """
+    return np.histogram2d(x, y, bins=resolucion)
+
+
+def muestra_atipicos(x, y, conteos, bordes_x, bordes_y, max_conteo=2, k=1000, semilla=0):
+    """
+    Muestra por reservorio de los puntos ubicados en celdas con a lo sumo
+    `max_conteo` puntos.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    celda_x = np.clip(np.searchsorted(bordes_x, x, side="right") - 1, 0, len(bordes_x) - 2)
+    celda_y = np.clip(np.searchsorted(bordes_y, y, side="right") - 1, 0, len(bordes_y) - 2)
+    dispersos = conteos[celda_x, celda_y] <= max_conteo
+    return MuestraReservorio(k, semilla).agregar(x[dispersos], y[dispersos])
+
+
+def dispersion_densidad(ax, x, y, resolucion=RESOLUCION, atipicos=True, color="crimson"):
+    """
+    Dibuja en `ax` la densidad de los puntos (x, y) y, si se pide, una muestra
+    de los atípicos encima. Devuelve el objeto de la grilla para agregar una
+    barra de color.
+    """
+    from matplotlib.colors import LogNorm
+
+    conteos, bordes_x, bordes_y = grilla_densidad(x, y, resolucion)
+    # Las celdas vacías quedan transparentes
+    malla = ax.pcolormesh(
+        bordes_x, bordes_y, np.ma.masked_equal(conteos, 0).T,
+        cmap="Blues", norm=LogNorm(),
+    )
+    if atipicos:
+        muestra = muestra_atipicos(x, y, conteos, bordes_x, bordes_y)
+        if len(muestra.x):
+            ax.scatter(muestra.x, muestra.y, s=4, alpha=0.6, color=color, label="Atípicos (muestra)")
+            ax.legend(loc="upper left")
+    return malla
@@ -0,0 +1,85 @@
+"""
+Estandarización con estadísticas acumuladas (conteo, media y M2 por columna).
+
+Las estadísticas se calculan por bloques y se combinan con la fórmula de Chan et
+al., por lo que pueden actualizarse a medida que llegan filas nuevas o unirse
+entre fragmentos sin volver a ajustar sobre todos los datos. Las columnas
+estandarizadas se generan sólo cuando se piden, en float32 y en un DataFrame
+aparte, sin ensanchar el DataFrame base.
+"""
+import numpy as np
+import pandas as pd
+
+from analitica.snapshot import escribir_arrow, leer_arrow
+
+
+class EstadisticasEscalado:
+    """
+    Conteo, media y suma de cuadrados de las desviaciones (M2) por columna.
+    """
+
+    def __init__(self, estadisticas):
+        # DataFrame indexado por columna con `n`, `media` y `m2`
+        self.estadisticas = estadisticas
+
+    @property
+    def columnas(self):
+        return list(self.estadisticas.index)
+
+    @classmethod
+    def desde_bloque(cls, df, columnas):
+        """
+        Calcula las estadísticas de un bloque de filas.
+        """
+        valores = df[columnas].to_numpy(dtype=np.float64)
+        n = np.full(len(columnas), len(valores), dtype=np.int64)
+        media = valores.mean(axis=0) if len(valores) else np.zeros(len(columnas))
+        m2 = ((valores - media) ** 2).sum(axis=0)
+        estadisticas = pd.DataFrame({"n": n, "media": media, "m2": m2}, index=pd.Index(columnas, name="columna"))
+        return cls(estadisticas)
+
+    def combinar(self, otro):
+        """
+        Une las estadísticas de dos conjuntos disjuntos de filas.
+        """
+        a, b = self.estadisticas, otro.estadisticas.loc[self.estadisticas.index]
+        n = a["n"] + b["n"]
+        delta = b["media"] - a["media"]
+        # Evita dividir por cero si ambos lados están vacíos
+        proporcion = (b["n"] / n.where(n > 0, 1))
+        media = a["media"] + delta * proporcion
+        m2 = a["m2"] + b["m2"] + delta ** 2 * a["n"] * proporcion
+        return EstadisticasEscalado(pd.DataFrame({"n": n, "media": media, "m2": m2}))
+
+    def desviaciones(self):
+        """
+        Desviación estándar poblacional (ddof=0), la misma que usa StandardScaler.
+        """
+        e = self.estadisticas
+        return np.sqrt(e["m2"] / e["n"].where(e["n"] > 0, 1))
+
+    def transformar(self, df, columnas=None, sufijo="_norm"):
+        """
+        Devuelve un DataFrame nuevo con las columnas estandarizadas en float32.
+        """
+        columnas = columnas or self.columnas
+        media = self.estadisticas.loc[columnas, "media"].to_numpy()
+        desviacion = self.desviaciones().loc[columnas].to_numpy()
+        # Columnas constantes: se dejan en cero, como StandardScaler
+        desviacion = np.where(desviacion == 0, 1, desviacion)
+        valores = (df[columnas].to_numpy(dtype=np.float32) - media.astype(np.float32)) / desviacion.astype(np.float32)
+        return pd.DataFrame(valores, columns=[c + sufijo for c in columnas], index=df.index)
+
+    def tamano_en_memoria(self):
+        return int(self.estadisticas.memory_usage(deep=True).sum())
+
+    def guardar(self, ruta, metadatos=None):
+        escribir_arrow(self.estadisticas.reset_index(), ruta, metadatos)
+
+    @classmethod
+    def leer(cls, ruta):
+        """
+        Lee estadísticas guardadas con `guardar`. Devuelve (estadísticas, metadatos).
+        """
+        tabla, metadatos = leer_arrow(ruta)
+        return cls(tabla.set_index("columna")), metadatos
@@ -0,0 +1,334 @@
+"""
+Carga del conjunto de datos de estudiantes.
+"""
+import functools
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pandas.api.types import union_categoricals
+
+from analitica.bosquejos import K_POR_DEFECTO, ResumenAproximado
+from analitica.cache import cache_datasets
+from analitica.cubo import CuboResumen
+from analitica.escalado import EstadisticasEscalado
+from analitica.explorador import ExploradorPaginado
+from analitica.indice import IndiceOrdenado
+from analitica.incremental import AcumuladorIncremental
+from analitica.paralelo import mapear_en_paralelo
+from analitica.perfilado import perfilador
+from analitica.snapshot import leer_columnas
+
+RUTA_DATOS = "desafio_analisis_estudiantes/data/datos_estudiantes_desafio.csv"
+
+# Columnas de calificaciones por asignatura
+NOTAS = ["Nota_Matemáticas", "Nota_Lenguaje", "Nota_Ciencias"]
+
+# Columnas que se estandarizan en el preprocesamiento
+COLUMNAS_ESCALADO = NOTAS + ["Horas_de_estudio"]
+
+# Columnas con índice ordenado para los filtros por rango
+COLUMNAS_INDICE = ["Promedio"] + NOTAS + ["Edad", "Horas_de_estudio"]
+
+# Dimensiones del cubo de resumen
+DIMENSIONES = ["Comuna", "Genero", "Edad"]
+
+# Esquema compacto: enteros angostos para rangos pequeños y categorías para texto repetido
+ESQUEMA = {
+    "Estudiante_ID": "uint32",
+    "Edad": "uint8",
+    "Horas_de_estudio": "uint8",
+    "Nota_Matemáticas": "uint8",
+    "Nota_Lenguaje": "uint8",
+    "Nota_Ciencias": "uint8",
+    "Genero": "category",
+    "Comuna": "category",
+}
+
+CATEGORICAS = [columna for columna, tipo in ESQUEMA.items() if tipo == "category"]
+
+# Columnas numéricas, las mismas que resume `df.describe()`
+NUMERICAS = [columna for columna in ESQUEMA if columna not in CATEGORICAS]
+
+# Tipos Arrow de la instantánea; las categóricas se guardan como texto y se codifican al leer
+TIPOS_ARROW = {
+    columna: pa.string() if tipo == "category" else pa.from_numpy_dtype(np.dtype(tipo))
+    for columna, tipo in ESQUEMA.items()
+}
+
+
+def validar_esquema(df):
+    """
+    Verifica que las columnas cargadas tengan los tipos declarados en ESQUEMA.
+
+    Una columna entera con valores nulos llega como float, por lo que también queda
+    cubierta por esta verificación. Lanza ValueError si algo no coincide.
+    """
+    errores = [
+        f"{columna}: se esperaba {ESQUEMA[columna]}, se obtuvo {df[columna].dtype}"
+        for columna in df.columns
+        if columna in ESQUEMA and str(df[columna].dtype) != ESQUEMA[columna]
+    ]
+    if errores:
+        raise ValueError("El conjunto de datos no cumple el esquema: " + "; ".join(errores))
+
+
+def cargar_estudiantes(ruta=RUTA_DATOS, columnas=None):
+    """
+    Devuelve el DataFrame de estudiantes (o sólo las columnas pedidas) desde la
+    instantánea columnar, cacheado entre sesiones y validado contra ESQUEMA.
+
+    El DataFrame cacheado es compartido entre sesiones, por lo que se entrega una
+    copia superficial: agregar columnas no modifica la entrada de la caché.
+    """
+    with perfilador.medir("Carga del CSV"):
+        if isinstance(ruta, (list, tuple)):
+            df = cache_datasets.obtener(
+                ruta,
+                lambda rutas: _concatenar([_leer(r, columnas) for r in rutas]),
+                variante=("fragmentos", tuple(columnas) if columnas is not None else None),
+            )
+        else:
+            df = _leer(ruta, columnas)
+    validar_esquema(df)
+    return df.copy(deep=False)
+
+
+def _leer(ruta, columnas):
+    return leer_columnas(ruta, columnas, tipos=TIPOS_ARROW, categoricas=CATEGORICAS)
+
+
+def _concatenar(fragmentos):
+    # Las categorías de cada fragmento se unen para que las columnas sigan siendo categóricas
+    columnas = list(fragmentos[0].columns)
+    categoricas = {
+        columna: union_categoricals([f[columna] for f in fragmentos], sort_categories=True)
+        for columna in columnas
+        if columna in CATEGORICAS
+    }
+    df = pd.concat([f.drop(columns=list(categoricas)) for f in fragmentos], ignore_index=True)
+    for columna, valores in categoricas.items():
+        df[columna] = valores
+    return df[columnas]
+
+
+def reporte_memoria(df):
+    """
+    Compara los bytes por columna del esquema compacto con los tipos que produce
+    `pd.read_csv` sin esquema (int64 para números y object para texto).
+    """
+    filas = []
+    for columna in df.columns:
+        serie = df[columna]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            antes = serie.astype(object).memory_usage(deep=True, index=False)
+        else:
+            antes = len(serie) * np.dtype("int64").itemsize
+        despues = serie.memory_usage(deep=True, index=False)
+        filas.append((columna, str(serie.dtype), antes, despues))
+
+    reporte = pd.DataFrame(filas, columns=["Columna", "Tipo", "Bytes antes", "Bytes después"])
+    reporte = reporte.set_index("Columna")
+    reporte.loc["Total"] = ["", reporte["Bytes antes"].sum(), reporte["Bytes después"].sum()]
+    reporte["Reducción"] = (reporte["Bytes antes"] / reporte["Bytes después"]).round(1)
+    return reporte
+
+
+def ruta_cubo(ruta):
+    """
+    Devuelve la ruta donde se persiste el cubo de resumen de un CSV.
+    """
+    return os.path.splitext(ruta)[0] + ".cubo.arrow"
+
+
+def ruta_escalado(ruta):
+    """
+    Devuelve la ruta donde se persisten las estadísticas de estandarización de un CSV.
+    """
+    return os.path.splitext(ruta)[0] + ".escalado.arrow"
+
+
+def _construir_cubo(df):
+    return CuboResumen.construir(df, DIMENSIONES, NOTAS)
+
+
+def _combinar_cubos(cubo, otro):
+    return CuboResumen.combinar([cubo, otro])
+
+
+def _guardar(agregado, ruta, metadatos):
+    agregado.guardar(ruta, metadatos)
+
+
+def _construir_escalado(df):
+    return EstadisticasEscalado.desde_bloque(df, COLUMNAS_ESCALADO)
+
+
+def _combinar_escalados(escalado, otro):
+    return escalado.combinar(otro)
+
+
+# Acumuladores incrementales por archivo y tipo de agregado (uno por proceso)
+_acumuladores = {}
+_lock_acumuladores = threading.Lock()
+
+
+def _acumulador(ruta, tipo, crear):
+    clave = (os.path.abspath(ruta), tipo)
+    with _lock_acumuladores:
+        if clave not in _acumuladores:
+            _acumuladores[clave] = crear(ruta)
+        return _acumuladores[clave]
+
+
+def _opciones_lectura(columnas):
+    return {"usecols": columnas, "dtype": {columna: ESQUEMA[columna] for columna in columnas}}
+
+
+def acumulador_cubo(ruta):
+    """
+    Devuelve el acumulador incremental del cubo de un CSV.
+
+    El estado (cubo, byte procesado y huella) se persiste en `ruta_cubo(ruta)`, de
+    modo que al agregar filas al CSV sólo se interpreta la cola nueva, también
+    entre procesos.
+    """
+    return _acumulador(ruta, "cubo", lambda r: AcumuladorIncremental(
+        r,
+        _construir_cubo,
+        _combinar_cubos,
+        opciones_lectura=_opciones_lectura(DIMENSIONES + NOTAS),
+        ruta_estado=ruta_cubo(r),
+        guardar=_guardar,
+        leer=CuboResumen.leer,
+    ))
+
+
+def acumulador_escalado(ruta):
+    """
+    Devuelve el acumulador incremental de las estadísticas de estandarización,
+    persistidas en `ruta_escalado(ruta)`.
+    """
+    return _acumulador(ruta, "escalado", lambda r: AcumuladorIncremental(
+        r,
+        _construir_escalado,
+        _combinar_escalados,
+        opciones_lectura=_opciones_lectura(COLUMNAS_ESCALADO),
+        ruta_estado=ruta_escalado(r),
+        guardar=_guardar,
+        leer=EstadisticasEscalado.leer,
+    ))
+
+
+def acumulador_bosquejos(ruta, k=K_POR_DEFECTO):
+    """
+    Devuelve el acumulador incremental de los bosquejos de NUMERICAS y de la
+    frecuencia de Edad. El estado se mantiene sólo en memoria del proceso.
+    """
+    return _acumulador(ruta, ("bosquejos", k), lambda r: AcumuladorIncremental(
+        r,
+        lambda df: ResumenAproximado.desde_bloque(df, NUMERICAS, ["Edad"], k=k),
+        ResumenAproximado.combinar,
+        opciones_lectura=_opciones_lectura(NUMERICAS),
+    ))
+
+
+def _leer_o_construir_cubo(ruta):
+    return acumulador_cubo(ruta).actualizar()
+
+
+def _leer_o_construir_escalado(ruta):
+    return acumulador_escalado(ruta).actualizar()
+
+
+def obtener_cubo(ruta=RUTA_DATOS, trabajadores=None):
+    """
+    Devuelve el cubo de resumen Comuna × Genero × Edad de las notas.
+
+    Se cachea por versión del CSV y se persiste junto a él para reutilizarlo entre
+    procesos; cuando el CSV crece sólo se procesan las filas nuevas. Si `ruta` es
+    una lista de fragmentos, cada uno se resume en un proceso trabajador y los
+    cubos parciales se combinan.
+    """
+    if isinstance(ruta, (list, tuple)):
+        return cache_datasets.obtener(
+            ruta,
+            lambda rutas: CuboResumen.combinar(
+                mapear_en_paralelo(_leer_o_construir_cubo, list(rutas), trabajadores)
+            ),
+            variante="cubo",
+        )
+    return cache_datasets.obtener(ruta, _leer_o_construir_cubo, variante="cubo")
+
+
+def obtener_escalado(ruta=RUTA_DATOS, trabajadores=None):
+    """
+    Devuelve las estadísticas de estandarización de COLUMNAS_ESCALADO.
+
+    Igual que el cubo, se actualizan de forma incremental cuando el CSV crece y,
+    con una lista de fragmentos, se calculan en paralelo y se combinan.
+    """
+    if isinstance(ruta, (list, tuple)):
+        return cache_datasets.obtener(
+            ruta,
+            lambda rutas: functools.reduce(
+                _combinar_escalados,
+                mapear_en_paralelo(_leer_o_construir_escalado, list(rutas), trabajadores),
+            ),
+            variante="escalado",
+        )
+    return cache_datasets.obtener(ruta, _leer_o_construir_escalado, variante="escalado")
+
+
+def _actualizar_bosquejos(ruta, k):
+    return acumulador_bosquejos(ruta, k).actualizar()
+
+
+def obtener_resumen_aproximado(ruta=RUTA_DATOS, k=K_POR_DEFECTO, trabajadores=None):
+    """
+    Devuelve los bosquejos de cuantiles de NUMERICAS y de frecuencias de Edad.
+
+    El CSV se recorre por bloques, así que la memoria no depende del tamaño del
+    dataset; `k` controla la precisión (error de rango ~1.3 % con k=200). Con una
+    lista de fragmentos, cada uno se resume en paralelo y los bosquejos se combinan.
+    """
+    if isinstance(ruta, (list, tuple)):
+        return cache_datasets.obtener(
+            ruta,
+            lambda rutas: functools.reduce(
+                ResumenAproximado.combinar,
+                mapear_en_paralelo(functools.partial(_actualizar_bosquejos, k=k), list(rutas), trabajadores),
+            ),
+            variante=("bosquejos", k),
+        )
+    return cache_datasets.obtener(ruta, lambda r: _actualizar_bosquejos(r, k), variante=("bosquejos", k))
+
+
+def _construir_indice(ruta):
+    df = cargar_estudiantes(ruta, ["Estudiante_ID", "Edad", "Horas_de_estudio"] + NOTAS + ["Genero", "Comuna"])
+    df["Promedio"] = df[NOTAS].mean(axis=1)
+    # Desplazamientos por categoría sólo para Comuna (el filtro de la app); del
+    # DataFrame se conservan sólo las columnas que devuelve `primeras_filas`
+    return IndiceOrdenado(df, COLUMNAS_INDICE, categoricas=["Comuna"], conservar=["Estudiante_ID"] + COLUMNAS_INDICE)
+
+
+def obtener_indice(ruta=RUTA_DATOS):
+    """
+    Devuelve el índice ordenado de COLUMNAS_INDICE (incluido el promedio por
+    estudiante), construido una vez por versión del dataset.
+    """
+    return cache_datasets.obtener(ruta, _construir_indice, variante="indice")
+
+
+def obtener_explorador(ruta=RUTA_DATOS):
+    """
+    Devuelve el explorador paginado del dataset, ordenable por las columnas del
+    índice ordenado. El índice se construye recién al ordenar o al mostrar el promedio.
+    """
+    return cache_datasets.obtener(
+        ruta,
+        lambda r: ExploradorPaginado(r, TIPOS_ARROW, lambda: obtener_indice(r), COLUMNAS_INDICE),
+        variante="explorador",
+    )
@@ -0,0 +1,89 @@
+"""
+Exploración paginada de un dataset sin cargarlo completo.
+
+Las filas se leen de la instantánea Arrow mapeada en memoria: cada página es un
+`slice` (orden del archivo) o un `take` con las posiciones del índice ordenado
+(orden por columna), y sólo esas filas se convierten a pandas. El costo de cada
+página es proporcional a su tamaño y no al del dataset.
+
+El índice ordenado sólo se pide al ordenar por una columna o al mostrar una
+columna calculada, de modo que recorrer el archivo en su orden no lo construye.
+"""
+import pyarrow as pa
+
+from analitica.snapshot import leer_tabla
+
+
+class ExploradorPaginado:
+    """
+    Páginas de filas de uno o varios CSV (fragmentos) a partir de sus instantáneas.
+
+    `indice` (opcional) es una función sin argumentos que devuelve un
+    IndiceOrdenado sobre las mismas filas, y `columnas_indice` sus columnas:
+    permiten ordenar las páginas por ellas y mostrar las que no están en el CSV.
+    """
+
+    def __init__(self, ruta, tipos=None, indice=None, columnas_indice=()):
+        rutas = ruta if isinstance(ruta, (list, tuple)) else [ruta]
+        # Tablas mapeadas desde disco: concatenarlas no copia datos
+        self.tabla = pa.concat_tables([leer_tabla(r, tipos=tipos) for r in rutas])
+        self._indice = indice
+        self.columnas_indice = list(columnas_indice) if indice is not None else []
+
+    @property
+    def columnas(self):
+        return self.tabla.column_names
+
+    @property
+    def columnas_ordenables(self):
+        return list(self.columnas_indice)
+
+    @property
+    def columnas_calculadas(self):
+        # Columnas que sólo existen en el índice (por ejemplo, el promedio por estudiante)
+        return [c for c in self.columnas_indice if c not in self.tabla.column_names]
+
+    def __len__(self):
+        return self.tabla.num_rows
+
+    def total_paginas(self, tamano):
+        return max(1, -(-len(self) // tamano))
+
+    def pagina(self, numero, tamano, columnas=None, orden=None, descendente=False):
+        """
+        Devuelve la página `numero` (desde 0) de `tamano` filas como DataFrame.
+
+        `orden` es una columna del índice; sin él se respeta el orden del archivo.
+        Las columnas calculadas del índice (como el promedio) también se pueden pedir.
+        """
+        inicio = numero * tamano
+        fin = min(inicio + tamano, len(self))
+        if orden is None:
+            filas = self.tabla.slice(inicio, max(0, fin - inicio))
+            posiciones = None
+        else:
+            orden_filas = self._indice().posiciones(orden)
+            if descendente:
+                # Sólo se invierte el tramo de la página, no el arreglo completo
+                posiciones = orden_filas[len(self) - fin:len(self) - inicio][::-1]
+            else:
+                posiciones = orden_filas[inicio:fin]
+            filas = self.tabla.take(pa.array(posiciones))
+
+        columnas = list(columnas or self.columnas)
+        propias = [c for c in columnas if c in self.tabla.column_names]
+        df = filas.select(propias).to_pandas()
+
+        calculadas = [c for c in columnas if c in self.columnas_calculadas]
+        if calculadas:
+            datos = self._indice().datos
+            for columna in calculadas:
+                valores = datos[columna].to_numpy()
+                df[columna] = valores[posiciones] if posiciones is not None else valores[inicio:fin]
+
+        df.index = posiciones if posiciones is not None else range(inicio, fin)
+        return df[columnas]
+
+    def tamano_en_memoria(self):
+        # Los buffers de la tabla están mapeados desde disco y no ocupan memoria propia
+        return 0
@@ -0,0 +1,76 @@
+"""
+Caché de figuras de matplotlib ya rasterizadas.
+
+Las figuras se dibujan una sola vez por versión del dataset y combinación de
+parámetros; lo que se guarda son los bytes PNG/SVG resultantes, y la figura se
+cierra inmediatamente después de rasterizarla para que no se acumule en pyplot.
+"""
+import hashlib
+import io
+import os
+
+from analitica.cache import cache_datasets, version_archivo
+
+# Misma resolución que usa st.pyplot por defecto
+DPI = 200
+
+
+def renderizar(figura, formato="png", dpi=DPI):
+    """
+    Rasteriza una figura a bytes y la cierra.
+    """
+    # pyplot se importa aquí para que usar la caché no cargue matplotlib
+    import matplotlib.pyplot as plt
+
+    try:
+        buffer = io.BytesIO()
+        figura.savefig(buffer, format=formato, dpi=dpi, bbox_inches="tight")
+        return buffer.getvalue()
+    finally:
+        plt.close(figura)
+
+
+def figura_cacheada(ruta, nombre, dibujar, formato="png", **parametros):
+    """
+    Devuelve los bytes de la figura `nombre` para la versión actual de `ruta`.
+
+    `dibujar(ruta, **parametros)` debe crear y devolver la figura; sólo se llama
+    cuando no hay una imagen cacheada para esa versión y esos parámetros.
+    """
+    variante = ("figura", nombre, formato, tuple(sorted(parametros.items())))
+    return cache_datasets.obtener(
+        ruta,
+        lambda r: renderizar(dibujar(r, **parametros), formato),
+        variante=variante,
+    )
+
+
+def clave_figura(ruta, nombre, **parametros):
+    """
+    Huella de la versión del dataset y los parámetros de una figura.
+    """
+    contenido = repr((version_archivo(ruta), nombre, sorted(parametros.items())))
+    return hashlib.sha256(contenido.encode()).hexdigest()
+
+
+def guardar_figura(ruta, destino, nombre, dibujar, **parametros):
+    """
+    Escribe la figura en `destino` sólo si cambió el dataset o los parámetros.
+
+    Junto a la imagen se guarda un archivo ``.clave`` con la huella usada para
+    generarla. Devuelve True si la figura se volvió a dibujar.
+    """
+    clave = clave_figura(ruta, nombre, **parametros)
+    ruta_clave = destino + ".clave"
+    if os.path.exists(destino) and os.path.exists(ruta_clave):
+        with open(ruta_clave) as archivo:
+            if archivo.read().strip() == clave:
+                return False
+
+    formato = os.path.splitext(destino)[1].lstrip(".") or "png"
+    contenido = figura_cacheada(ruta, nombre, dibujar, formato, **parametros)
+    with open(destino, "wb") as archivo:
+        archivo.write(contenido)
+    with open(ruta_clave, "w") as archivo:
+        archivo.write(clave)
+    return True
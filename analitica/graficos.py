@@ -0,0 +1,99 @@
+"""
+Gráficos del análisis de estudiantes.
+
+matplotlib se importa dentro de cada función, sólo cuando hay que dibujar una
+figura que no está en la caché de figuras.
+"""
+from analitica.calculos import calcular_promedio_estudiante
+from analitica.densidad import RESOLUCION, UMBRAL_FILAS_DENSIDAD, dispersion_densidad
+from analitica.estudiantes import NOTAS, cargar_estudiantes, obtener_cubo
+from analitica.figuras import figura_cacheada
+
+
+def dibujar_histogramas(ruta, bins):
+    import matplotlib.pyplot as plt
+
+    # Los histogramas sólo necesitan las columnas de notas
+    df_notas = cargar_estudiantes(ruta, NOTAS)
+
+    # Crear figura y ejes
+    fig, axes = plt.subplots(1, 3, figsize=(15, 6))
+
+    # Histograma para Matemáticas
+    df_notas['Nota_Matemáticas'].plot(kind='hist', bins=bins, alpha=0.7, ax=axes[0], color='blue')
+    axes[0].set_title('Distribución de Calificaciones - Matemáticas')
+    axes[0].set_xlabel('Calificación')
+    axes[0].set_ylabel('Frecuencia')
+
+    # Histograma para Lenguaje
+    df_notas['Nota_Lenguaje'].plot(kind='hist', bins=bins, alpha=0.7, ax=axes[1], color='red')
+    axes[1].set_title('Distribución de Calificaciones - Lenguaje')
+    axes[1].set_xlabel('Calificación')
+    axes[1].set_ylabel('Frecuencia')
+
+    # Histograma para Ciencias
+    df_notas['Nota_Ciencias'].plot(kind='hist', bins=bins, alpha=0.7, ax=axes[2], color='green')
+    axes[2].set_title('Distribución de Calificaciones - Ciencias')
+    axes[2].set_xlabel('Calificación')
+    axes[2].set_ylabel('Frecuencia')
+
+    # Ajuste del espaciado
+    fig.tight_layout()
+    return fig
+
+
+def dibujar_barras_comuna(ruta):
+    import matplotlib.pyplot as plt
+
+    # Calcular el promedio de calificaciones por comuna desde el cubo
+    comuna_promedio = obtener_cubo(ruta).promedios('Comuna')
+
+    # Crear el gráfico de barras
+    fig, ax = plt.subplots(figsize=(12, 6))
+    comuna_promedio.plot(kind='bar', ax=ax, color=['blue', 'red', 'green'])
+
+    # Personalizar el gráfico
+    ax.set_title('Promedio de Calificaciones por Comuna')
+    ax.set_xlabel('Comuna')
+    ax.set_ylabel('Promedio de Calificación')
+    ax.set_xticks(range(len(comuna_promedio.index)))
+    ax.set_xticklabels(comuna_promedio.index, rotation=45)
+    ax.legend(['Matemáticas', 'Lenguaje', 'Ciencias'])
+    return fig
+
+
+def dibujar_dispersion(ruta, umbral_densidad, resolucion):
+    import matplotlib.pyplot as plt
+
+    df = calcular_promedio_estudiante(ruta)
+
+    # Crear el gráfico de dispersión; con muchas filas se dibuja la densidad por celdas
+    fig, ax = plt.subplots(figsize=(10, 6))
+    if len(df) > umbral_densidad:
+        malla = dispersion_densidad(ax, df['Promedio'], df['Nota_Matemáticas'], resolucion)
+        fig.colorbar(malla, ax=ax, label='Estudiantes por celda')
+    else:
+        ax.scatter(df['Promedio'], df['Nota_Matemáticas'], alpha=0.5, color='blue')
+
+    # Personalizar el gráfico
+    ax.set_title('Relación entre Horas de Estudio y el Promedio')
+    ax.set_xlabel('Horas de Estudio')
+    ax.set_ylabel('Promedio')
+    return fig
+
+
+# Figuras del análisis: clave -> (título de la sección, función de dibujo, parámetros)
+FIGURAS = {
+    "histogramas": ("Ver distribuciones de calificaciones", dibujar_histogramas, {"bins": 50}),
+    "barras_comuna": ("Ver gráfico de barras del promedio de calificaciones por comuna", dibujar_barras_comuna, {}),
+    "dispersion": ("Ver gráfico de dispersión", dibujar_dispersion, {"umbral_densidad": UMBRAL_FILAS_DENSIDAD, "resolucion": RESOLUCION}),
+}
+
+
+def imagen(clave):
+    """
+    Devuelve una función que entrega los bytes PNG de la figura `clave` desde la
+    caché de figuras.
+    """
+    _, dibujar, parametros = FIGURAS[clave]
+    return lambda ruta: figura_cacheada(ruta, clave, dibujar, **parametros)
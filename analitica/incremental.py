@@ -0,0 +1,213 @@
+"""
+Actualización incremental de agregados sobre CSV que sólo crecen por el final.
+
+Se recuerda hasta qué byte del archivo se procesó y una huella del contenido ya
+leído. Si el archivo creció y la huella coincide, sólo se interpreta la cola
+agregada y se combina con el agregado existente; si el archivo se truncó o se
+reescribió, se reconstruye desde cero. También se recuerdan su tamaño y su fecha
+de modificación: si cambió la fecha pero el archivo no creció, se reescribió en
+el lugar (quizás con el mismo tamaño) y también se reconstruye.
+
+El estado guardado sólo cubre líneas terminadas en salto de línea. Una última
+línea sin él (un archivo que no termina en salto de línea, o una línea todavía en
+escritura) se interpreta aparte en cada actualización y se combina con el
+agregado devuelto, sin incorporarla al estado; así el resultado cuenta las
+mismas filas que la lectura completa del archivo.
+"""
+import hashlib
+import io
+import os
+import threading
+
+import pandas as pd
+
+# Bytes del inicio y del final de la parte procesada que forman la huella
+BYTES_HUELLA = 64 * 1024
+
+# Filas por bloque al interpretar el archivo
+TAMANO_BLOQUE = 1_000_000
+
+
+class TramoArchivo(io.RawIOBase):
+    """
+    Archivo de sólo lectura que expone únicamente los bytes [inicio, fin) de otro.
+    """
+
+    def __init__(self, ruta, inicio, fin):
+        super().__init__()
+        self._archivo = open(ruta, "rb")
+        self._archivo.seek(inicio)
+        self._restantes = fin - inicio
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = min(len(buffer), self._restantes)
+        leidos = self._archivo.readinto(memoryview(buffer)[:n]) if n else 0
+        self._restantes -= leidos
+        return leidos
+
+    def close(self):
+        self._archivo.close()
+        super().close()
+
+
+def fin_ultima_linea(ruta, tamano):
+    """
+    Posición justo después del último salto de línea antes de `tamano`, para no
+    interpretar una línea que todavía se está escribiendo.
+    """
+    with open(ruta, "rb") as archivo:
+        posicion = tamano
+        while posicion > 0:
+            inicio = max(0, posicion - BYTES_HUELLA)
+            archivo.seek(inicio)
+            bloque = archivo.read(posicion - inicio)
+            indice = bloque.rfind(b"\n")
+            if indice >= 0:
+                return inicio + indice + 1
+            posicion = inicio
+    return 0
+
+
+def huella(ruta, fin):
+    """
+    Huella del contenido [0, fin): primeros y últimos BYTES_HUELLA bytes.
+    """
+    resumen = hashlib.sha256()
+    with open(ruta, "rb") as archivo:
+        resumen.update(archivo.read(min(fin, BYTES_HUELLA)))
+        archivo.seek(max(0, fin - BYTES_HUELLA))
+        resumen.update(archivo.read(fin - max(0, fin - BYTES_HUELLA)))
+    return resumen.hexdigest()
+
+
+class AcumuladorIncremental:
+    """
+    Mantiene un agregado de un CSV de sólo-agregar al día leyendo únicamente las
+    filas nuevas.
+
+    - `construir(bloque)` resume un DataFrame de filas.
+    - `combinar(a, b)` suma dos agregados.
+    - `opciones_lectura` se pasan a `pd.read_csv` (tipos, columnas usadas, etc.).
+    - `guardar(agregado, ruta, metadatos)` y `leer(ruta) -> (agregado, metadatos)`
+      persisten el estado en `ruta_estado`, si se indica.
+    """
+
+    def __init__(self, ruta, construir, combinar, opciones_lectura=None,
+                 ruta_estado=None, guardar=None, leer=None, tamano_bloque=TAMANO_BLOQUE):
+        self.ruta = ruta
+        self.construir = construir
+        self.combinar = combinar
+        self.opciones_lectura = opciones_lectura or {}
+        self.ruta_estado = ruta_estado
+        self._guardar = guardar
+        self._leer = leer
+        self.tamano_bloque = tamano_bloque
+        self._lock = threading.Lock()
+
+        self.agregado = None
+        self.desplazamiento = 0
+        self.huella = None
+        self.columnas = None
+        # Tamaño y fecha de modificación del archivo en la última actualización
+        self.tamano = None
+        self.mtime_ns = None
+        # Tipo de la última actualización: "completa", "incremental" o "sin cambios"
+        self.ultima_actualizacion = None
+        self.bytes_procesados = 0
+
+        if ruta_estado and leer and os.path.exists(ruta_estado):
+            self._cargar_estado()
+
+    def _cargar_estado(self):
+        agregado, metadatos = self._leer(self.ruta_estado)
+        # Los estados sin tamaño ni fecha (de versiones anteriores) se descartan
+        if "desplazamiento" not in metadatos or "mtime_ns" not in metadatos:
+            return
+        self.agregado = agregado
+        self.desplazamiento = int(metadatos["desplazamiento"])
+        self.huella = metadatos["huella"]
+        self.columnas = metadatos["columnas_csv"].split(",")
+        self.tamano = int(metadatos["tamano"])
+        self.mtime_ns = int(metadatos["mtime_ns"])
+
+    def _guardar_estado(self):
+        if self.ruta_estado and self._guardar:
+            metadatos = {
+                "desplazamiento": self.desplazamiento,
+                "huella": self.huella,
+                "columnas_csv": ",".join(self.columnas),
+                "tamano": self.tamano,
+                "mtime_ns": self.mtime_ns,
+            }
+            self._guardar(self.agregado, self.ruta_estado, metadatos)
+
+    def _interpretar(self, inicio, fin, con_encabezado):
+        opciones = dict(self.opciones_lectura)
+        if not con_encabezado:
+            opciones.update(header=None, names=self.columnas)
+        agregado = None
+        with io.BufferedReader(TramoArchivo(self.ruta, inicio, fin)) as tramo:
+            for bloque in pd.read_csv(tramo, chunksize=self.tamano_bloque, **opciones):
+                parcial = self.construir(bloque)
+                agregado = parcial if agregado is None else self.combinar(agregado, parcial)
+        return agregado
+
+    def _leer_encabezado(self):
+        with open(self.ruta, "rb") as archivo:
+            encabezado = archivo.readline().decode("utf-8-sig").strip()
+        return encabezado.split(",")
+
+    def actualizar(self):
+        """
+        Pone el agregado al día con el archivo y lo devuelve.
+        """
+        with self._lock:
+            estado = os.stat(self.ruta)
+            tamano = estado.st_size
+            fin = fin_ultima_linea(self.ruta, tamano)
+
+            # Modificado sin crecer: se reescribió en el lugar, aunque la huella coincida
+            modificado_sin_crecer = estado.st_mtime_ns != self.mtime_ns and tamano <= (self.tamano or 0)
+            reescrito = (
+                self.agregado is None
+                or modificado_sin_crecer
+                or fin < self.desplazamiento
+                or huella(self.ruta, self.desplazamiento) != self.huella
+            )
+            if reescrito:
+                self.columnas = self._leer_encabezado()
+                self.agregado = self._interpretar(0, fin, con_encabezado=True)
+                self.ultima_actualizacion = "completa"
+                self.bytes_procesados = fin
+            elif fin > self.desplazamiento:
+                cola = self._interpretar(self.desplazamiento, fin, con_encabezado=False)
+                if cola is not None:
+                    self.agregado = self.combinar(self.agregado, cola)
+                self.ultima_actualizacion = "incremental"
+                self.bytes_procesados = fin - self.desplazamiento
+            else:
+                self.ultima_actualizacion = "sin cambios"
+                self.bytes_procesados = 0
+                self.tamano, self.mtime_ns = tamano, estado.st_mtime_ns
+                return self._con_linea_final(fin, tamano)
+
+            self.desplazamiento = fin
+            self.huella = huella(self.ruta, fin)
+            self.tamano = tamano
+            self.mtime_ns = estado.st_mtime_ns
+            self._guardar_estado()
+            return self._con_linea_final(fin, tamano)
+
+    def _con_linea_final(self, fin, tamano):
+        # Agregado más la última línea sin salto de línea, si la hay
+        if tamano <= fin:
+            return self.agregado
+        final = self._interpretar(fin, tamano, con_encabezado=fin == 0)
+        if final is None:
+            return self.agregado
+        if self.agregado is None:
+            return final
+        return self.combinar(self.agregado, final)
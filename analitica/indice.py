@@ -0,0 +1,122 @@
+"""
+Índices ordenados para consultas por rango sobre columnas numéricas.
+
+Cada columna indexada guarda el orden de sus filas y sus valores ordenados, de
+modo que un filtro `minimo < columna <= maximo` se resuelve con dos búsquedas
+binarias: O(log n) para contar y O(log n + k) para obtener las k filas. Para
+conjunciones con una categoría (por ejemplo, Comuna = X y Promedio > t) se ordena
+por (categoría, valor) y se guardan los desplazamientos de cada categoría; esto
+sólo se hace para las columnas categóricas indicadas, porque cada una agrega una
+copia ordenada de todas las columnas indexadas.
+
+Todos los arreglos se construyen junto con el índice, de modo que su tamaño en
+memoria no cambia después de entrar en la caché de datasets.
+"""
+import numpy as np
+
+
+def _tipo_posiciones(n):
+    # Posiciones de 4 bytes mientras alcancen, para reducir la memoria del índice
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+class IndiceOrdenado:
+    """
+    Índice ordenado de varias columnas de un DataFrame.
+
+    `datos` conserva sólo las columnas `conservar` del DataFrame de origen (por
+    defecto, las indexadas) para recuperar las filas encontradas, y `categorias`
+    las categorías de cada columna categórica.
+    """
+
+    def __init__(self, datos, columnas, categoricas=(), conservar=None):
+        self.columnas = list(columnas)
+        self.categoricas = list(categoricas)
+        self.datos = datos[list(conservar) if conservar is not None else self.columnas]
+        self.categorias = {categorica: datos[categorica].cat.categories for categorica in self.categoricas}
+        tipo = _tipo_posiciones(len(datos))
+        self._orden = {}
+        self._valores = {}
+        for columna in self.columnas:
+            valores = datos[columna].to_numpy()
+            orden = np.argsort(valores, kind="stable").astype(tipo)
+            self._orden[columna] = orden
+            self._valores[columna] = valores[orden]
+        # Índices por (columna, categórica): orden, valores ordenados y desplazamientos
+        self._por_categoria = {}
+        self._codigos = {}
+        for categorica, categorias in self.categorias.items():
+            self._codigos[categorica] = {valor: codigo for codigo, valor in enumerate(categorias)}
+            codigos = datos[categorica].cat.codes.to_numpy()
+            limites_categorias = np.arange(len(categorias) + 1)
+            for columna in self.columnas:
+                # Reordenar por código el orden por valor (estable) da el orden por (código, valor)
+                orden = self._orden[columna]
+                orden = orden[np.argsort(codigos[orden], kind="stable")]
+                limites = np.searchsorted(codigos[orden], limites_categorias)
+                self._por_categoria[(columna, categorica)] = (orden, datos[columna].to_numpy()[orden], limites)
+
+    def __len__(self):
+        return len(self.datos)
+
+    def _indice_categoria(self, columna, categorica):
+        return self._por_categoria[(columna, categorica)]
+
+    def _tramo(self, columna, categoria):
+        """
+        Devuelve (orden, valores) ordenados de la columna, restringidos a una
+        categoría (`(columna_categórica, valor)`) si se indica.
+        """
+        if categoria is None:
+            return self._orden[columna], self._valores[columna]
+        categorica, valor = categoria
+        orden, valores, limites = self._indice_categoria(columna, categorica)
+        codigo = self._codigos[categorica].get(valor)
+        if codigo is None:
+            return orden[:0], valores[:0]
+        inicio, fin = limites[codigo], limites[codigo + 1]
+        return orden[inicio:fin], valores[inicio:fin]
+
+    def _limites(self, valores, minimo, maximo, incluir_minimo, incluir_maximo):
+        inicio = 0 if minimo is None else np.searchsorted(valores, minimo, side="left" if incluir_minimo else "right")
+        fin = len(valores) if maximo is None else np.searchsorted(valores, maximo, side="right" if incluir_maximo else "left")
+        return inicio, max(inicio, fin)
+
+    def extremos(self, columna):
+        """
+        Valores mínimo y máximo de una columna, leídos del índice en O(1).
+        """
+        valores = self._valores[columna]
+        return valores[0], valores[-1]
+
+    def contar(self, columna, minimo=None, maximo=None, incluir_minimo=True, incluir_maximo=True, categoria=None):
+        """
+        Cantidad de filas con `columna` dentro del rango, en O(log n).
+        """
+        _, valores = self._tramo(columna, categoria)
+        inicio, fin = self._limites(valores, minimo, maximo, incluir_minimo, incluir_maximo)
+        return int(fin - inicio)
+
+    def posiciones(self, columna, minimo=None, maximo=None, incluir_minimo=True, incluir_maximo=True, categoria=None):
+        """
+        Posiciones de las filas con `columna` dentro del rango, ordenadas por valor.
+        """
+        orden, valores = self._tramo(columna, categoria)
+        inicio, fin = self._limites(valores, minimo, maximo, incluir_minimo, incluir_maximo)
+        return orden[inicio:fin]
+
+    def primeras_filas(self, posiciones, n=5):
+        """
+        Las `n` filas de menor posición (en el orden original del archivo) sin
+        ordenar todas las encontradas.
+        """
+        if len(posiciones) > n:
+            posiciones = np.partition(posiciones, n - 1)[:n]
+        return self.datos.iloc[np.sort(posiciones)]
+
+    def tamano_en_memoria(self):
+        total = self.datos.memory_usage(deep=True).sum()
+        total += sum(orden.nbytes for orden in self._orden.values())
+        total += sum(valores.nbytes for valores in self._valores.values())
+        total += sum(o.nbytes + v.nbytes + l.nbytes for o, v, l in self._por_categoria.values())
+        return int(total)
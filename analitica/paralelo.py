@@ -0,0 +1,37 @@
+"""
+Ejecución en paralelo sobre datasets repartidos en varios archivos (fragmentos).
+
+Cada fragmento se procesa en un proceso trabajador que devuelve un agregado
+parcial; los parciales se combinan después en el proceso principal.
+"""
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Procesos trabajadores por defecto (0 o vacío: uno por núcleo)
+TRABAJADORES = int(os.environ.get("ANALITICA_TRABAJADORES", "0")) or os.cpu_count() or 1
+
+
+def listar_fragmentos(origen):
+    """
+    Devuelve la lista ordenada de CSV de un directorio o de un patrón glob.
+    """
+    if os.path.isdir(origen):
+        origen = os.path.join(origen, "*.csv")
+    fragmentos = sorted(glob.glob(origen))
+    if not fragmentos:
+        raise FileNotFoundError(f"No se encontraron archivos CSV en {origen}")
+    return fragmentos
+
+
+def mapear_en_paralelo(funcion, rutas, trabajadores=None):
+    """
+    Aplica `funcion` a cada ruta en un pool de procesos y devuelve los resultados
+    en el mismo orden. Con un solo trabajador o un solo fragmento se ejecuta en el
+    proceso actual.
+    """
+    trabajadores = min(trabajadores or TRABAJADORES, len(rutas))
+    if trabajadores <= 1:
+        return [funcion(ruta) for ruta in rutas]
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        return list(pool.map(funcion, rutas))
@@ -0,0 +1,149 @@
+"""
+Instrumentación opcional de las secciones del análisis.
+
+Se activa para todo el proceso con la variable de entorno ANALITICA_PERFILADO=1,
+o para una ejecución concreta con `perfilador.iniciar_ejecucion(activo=True)`
+(la app lo hace con el parámetro de URL ``?perfilado=1``). Cada bloque medido
+registra tiempo de pared, tiempo de CPU, pico de memoria residente sobre el
+valor inicial y los aciertos/fallos de la caché de datasets.
+
+Desactivado, `medir` devuelve un contexto vacío y no mide nada. Los registros
+se emiten como JSON por el logger ``analitica.perfilado`` y se pueden exportar
+a CSV con `registros().to_csv()`.
+"""
+import contextlib
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+
+from analitica.cache import cache_datasets
+
+logger = logging.getLogger("analitica.perfilado")
+
+# Intervalo de muestreo de la memoria residente
+INTERVALO_MUESTREO = 0.01
+
+# Registros que se conservan en memoria (los más antiguos se descartan)
+MAXIMO_REGISTROS = 1000
+
+_NULO = contextlib.nullcontext()
+
+
+def memoria_residente():
+    """
+    Bytes residentes del proceso (Linux).
+    """
+    with open("/proc/self/statm") as archivo:
+        return int(archivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class MedidorMemoria:
+    """
+    Muestrea la memoria residente en un hilo y registra el pico sobre el valor inicial.
+    """
+
+    def __enter__(self):
+        self.inicial = self.pico = memoria_residente()
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._muestrear, daemon=True)
+        self._hilo.start()
+        return self
+
+    def _muestrear(self):
+        while not self._detener.wait(INTERVALO_MUESTREO):
+            self.pico = max(self.pico, memoria_residente())
+
+    def __exit__(self, *excepcion):
+        self._detener.set()
+        self._hilo.join()
+        self.pico = max(self.pico, memoria_residente())
+
+    @property
+    def delta_mb(self):
+        return (self.pico - self.inicial) / 2 ** 20
+
+
+class Perfilador:
+    """
+    Registra mediciones por bloque, agrupadas por ejecución (una por hilo a la vez).
+
+    El tiempo de CPU es el del proceso completo y los contadores de la caché son
+    compartidos, por lo que con varias sesiones simultáneas las cifras se mezclan.
+    """
+
+    def __init__(self, activo=False, maximo=MAXIMO_REGISTROS):
+        self.activo_global = activo
+        self._local = threading.local()
+        self._ejecuciones = itertools.count(1)
+        self._registros = deque(maxlen=maximo)
+        self._lock = threading.Lock()
+
+    @property
+    def activo(self):
+        return self.activo_global or getattr(self._local, "activo", False)
+
+    @property
+    def ejecucion(self):
+        return getattr(self._local, "ejecucion", None)
+
+    def iniciar_ejecucion(self, activo=False):
+        """
+        Comienza una ejecución en el hilo actual y devuelve su número.
+        """
+        self._local.activo = activo
+        self._local.ejecucion = next(self._ejecuciones)
+        return self._local.ejecucion
+
+    def medir(self, nombre):
+        """
+        Contexto que mide el bloque `nombre` si el perfilado está activo.
+        """
+        if not self.activo:
+            return _NULO
+        return self._medir(nombre)
+
+    @contextlib.contextmanager
+    def _medir(self, nombre):
+        cache_antes = cache_datasets.estadisticas()
+        with MedidorMemoria() as memoria:
+            inicio, cpu = time.perf_counter(), time.process_time()
+            try:
+                yield
+            finally:
+                segundos, segundos_cpu = time.perf_counter() - inicio, time.process_time() - cpu
+        cache_despues = cache_datasets.estadisticas()
+
+        registro = {
+            "ejecucion": self.ejecucion,
+            "inicio": time.time() - segundos,
+            "bloque": nombre,
+            "segundos": round(segundos, 4),
+            "segundos_cpu": round(segundos_cpu, 4),
+            "memoria_mb": round(memoria.delta_mb, 1),
+            "aciertos_cache": cache_despues["aciertos"] - cache_antes["aciertos"],
+            "fallos_cache": cache_despues["fallos"] - cache_antes["fallos"],
+        }
+        with self._lock:
+            self._registros.append(registro)
+        logger.info(json.dumps(registro, ensure_ascii=False))
+
+    def registros(self, ejecucion=None):
+        """
+        Devuelve los registros (de una ejecución, si se indica) como DataFrame.
+        """
+        with self._lock:
+            registros = [r for r in self._registros if ejecucion is None or r["ejecucion"] == ejecucion]
+        return pd.DataFrame(registros, columns=[
+            "ejecucion", "inicio", "bloque", "segundos", "segundos_cpu", "memoria_mb",
+            "aciertos_cache", "fallos_cache",
+        ])
+
+
+# Instancia única compartida por todo el proceso
+perfilador = Perfilador(activo=os.environ.get("ANALITICA_PERFILADO", "") not in ("", "0"))
@@ -0,0 +1,304 @@
+"""
+Reportes estáticos del análisis de estudiantes.
+
+Ejecuta el análisis completo una vez por versión del dataset y escribe un reporte
+autocontenido (HTML o Markdown, con las imágenes embebidas) junto al CSV, con
+todas las tablas, los gráficos y las conclusiones y notas. Junto al reporte se
+guarda la huella de la versión usada, de modo que la app puede servirlo sin
+recalcular nada mientras los datos no cambien.
+
+    python -m analitica.reporte [CSV|directorio|glob ...] [--formato md]
+    python -m analitica.reporte --por-comuna reportes/comunas
+
+Con varios datasets, los reportes se generan en procesos trabajadores en paralelo.
+"""
+import argparse
+import base64
+import hashlib
+import html
+import math
+import os
+import re
+import textwrap
+from functools import partial
+
+import numpy as np
+
+from analitica.cache import version_archivo
+from analitica.calculos import ESTADISTICAS, calcular_estadisticas
+from analitica.estudiantes import RUTA_DATOS, cargar_estudiantes
+from analitica.graficos import FIGURAS, imagen
+from analitica.paralelo import listar_fragmentos, mapear_en_paralelo
+from analitica.snapshot import derivado_vigente
+from analitica.textos import CONCLUSIONES, NOTAS
+
+# Cambia cuando cambia el contenido o el formato de los reportes, para regenerarlos
+VERSION_REPORTE = 2
+
+FORMATOS = {"html": ".reporte.html", "md": ".reporte.md"}
+
+# Orden del reporte: subtítulo -> claves de ESTADISTICAS o de FIGURAS (como en la app)
+ESTRUCTURA = {
+    "Exploración de datos": ["primeras_filas", "ultimas_filas", "dimensiones", "describe", "info"],
+    "Limpieza de Datos": ["nulos"],
+    "Análisis Exploratorio": [
+        "edades", "promedio_asignaturas", "promedio_estudiante", "porcentaje_aprobados", "matematicas_por_comuna",
+    ],
+    "Filtros y Agrupaciones": ["promedio_mayor_80", "promedio_genero"],
+    "Preprocesamiento de Datos": ["normalizacion", "one_hot"],
+    "Visualizaciones": list(FIGURAS),
+}
+
+ESTILO = """
+body { font-family: sans-serif; max-width: 1100px; margin: 2rem auto; padding: 0 1rem; color: #222; }
+table { border-collapse: collapse; margin: 0.5rem 0 1rem; font-size: 0.9rem; }
+th, td { border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: right; }
+img { max-width: 100%; }
+"""
+
+
+def ruta_reporte(ruta, formato="html"):
+    """
+    Devuelve la ruta del reporte de un CSV en el formato indicado.
+    """
+    return os.path.splitext(ruta)[0] + FORMATOS[formato]
+
+
+def clave_reporte(ruta, formato="html"):
+    """
+    Huella de la versión del dataset, el formato y la versión de los reportes.
+    """
+    contenido = repr((version_archivo(ruta), formato, VERSION_REPORTE))
+    return hashlib.sha256(contenido.encode()).hexdigest()
+
+
+def reporte_vigente(ruta, formato="html"):
+    """
+    Indica si el reporte de `ruta` existe y corresponde a la versión actual del CSV.
+    """
+    destino = ruta_reporte(ruta, formato)
+    if not (os.path.exists(destino) and os.path.exists(destino + ".clave")):
+        return False
+    with open(destino + ".clave") as archivo:
+        return archivo.read().strip() == clave_reporte(ruta, formato)
+
+
+def _en_linea(texto):
+    texto = html.escape(texto)
+    texto = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", texto)
+    return re.sub(r"`(.+?)`", r"<code>\1</code>", texto)
+
+
+def markdown_a_html(texto):
+    """
+    Convierte el subconjunto de Markdown usado en `textos` (párrafos, listas
+    numeradas o con guiones anidadas por sangría, negritas y código) a HTML.
+    """
+    partes, listas, parrafo = [], [], []  # listas: pila de (sangría, etiqueta)
+
+    def cerrar_parrafo():
+        if parrafo:
+            partes.append(f"<p>{_en_linea(' '.join(parrafo))}</p>")
+            parrafo.clear()
+
+    def cerrar_listas(sangria=-1):
+        while listas and listas[-1][0] > sangria:
+            partes.append(f"</{listas.pop()[1]}>")
+
+    for linea in textwrap.dedent(texto).strip("\n").splitlines():
+        contenido = linea.strip()
+        sangria = len(linea) - len(linea.lstrip())
+        marca = re.match(r"(\d+\.|-)\s+(.*)", contenido)
+        if not contenido:
+            cerrar_parrafo()
+        elif marca:
+            cerrar_parrafo()
+            etiqueta = "ul" if marca.group(1) == "-" else "ol"
+            cerrar_listas(sangria)
+            if listas and listas[-1][0] == sangria and listas[-1][1] != etiqueta:
+                cerrar_listas(sangria - 1)
+            if not listas or listas[-1][0] < sangria:
+                listas.append((sangria, etiqueta))
+                partes.append(f"<{etiqueta}>")
+            partes.append(f"<li>{_en_linea(marca.group(2))}")
+        elif listas and sangria > listas[0][0]:
+            # Continuación del elemento de lista actual
+            partes.append(f"<br>{_en_linea(contenido)}")
+        else:
+            cerrar_listas()
+            parrafo.append(contenido)
+    cerrar_parrafo()
+    cerrar_listas()
+    return "\n".join(partes)
+
+
+def formatear_numero(valor):
+    """
+    Enteros sin decimales y el resto con separador de miles y dos decimales.
+    """
+    if math.isnan(valor):
+        return "NaN"
+    if float(valor).is_integer():
+        return str(int(valor))
+    return f"{valor:,.2f}"
+
+
+def tabla_html(tabla):
+    """
+    Devuelve `tabla` como tabla HTML, con los números formateados.
+    """
+    return tabla.to_html(border=0, float_format=formatear_numero)
+
+
+def tabla_markdown(tabla):
+    """
+    Devuelve `tabla` (con su índice) como tabla Markdown, con los números formateados.
+    """
+    tabla = tabla.reset_index()
+    filas = [[str(columna) for columna in tabla.columns]]
+    filas.append(["---"] * len(tabla.columns))
+    filas += [
+        [formatear_numero(valor) if isinstance(valor, (float, np.floating)) else str(valor) for valor in fila]
+        for fila in tabla.itertuples(index=False)
+    ]
+    return "\n".join("| " + " | ".join(fila) + " |" for fila in filas)
+
+
+def _imagen_base64(contenido):
+    return "data:image/png;base64," + base64.b64encode(contenido).decode()
+
+
+def _secciones(ruta):
+    # (subtítulo, [(título, tablas o None, imagen o None)])
+    estadisticas = calcular_estadisticas(ruta, [c for claves in ESTRUCTURA.values() for c in claves if c in ESTADISTICAS])
+    for subtitulo, claves in ESTRUCTURA.items():
+        secciones = []
+        for clave in claves:
+            if clave in ESTADISTICAS:
+                secciones.append((ESTADISTICAS[clave][0], estadisticas[clave], None))
+            else:
+                secciones.append((FIGURAS[clave][0], None, imagen(clave)(ruta)))
+        yield subtitulo, secciones
+
+
+def construir_html(ruta):
+    """
+    Devuelve el reporte HTML autocontenido de `ruta`.
+    """
+    titulo = f"Análisis de Datos de Estudiantes — {os.path.basename(ruta)}"
+    partes = [
+        "<!DOCTYPE html>", "<html lang='es'>", "<head>", "<meta charset='utf-8'>",
+        f"<title>{html.escape(titulo)}</title>", f"<style>{ESTILO}</style>", "</head>", "<body>",
+        f"<h1>{html.escape(titulo)}</h1>",
+    ]
+    for subtitulo, secciones in _secciones(ruta):
+        partes.append(f"<h2>{html.escape(subtitulo)}</h2>")
+        for titulo_seccion, tablas, contenido in secciones:
+            partes.append(f"<h3>{html.escape(titulo_seccion)}</h3>")
+            if tablas is not None:
+                partes += [tabla_html(tabla) for tabla in tablas.values()]
+            else:
+                partes.append(f"<img src='{_imagen_base64(contenido)}' alt='{html.escape(titulo_seccion)}'>")
+
+    partes.append("<h2>Conclusiones</h2>")
+    for seccion, texto in CONCLUSIONES.items():
+        partes += [f"<h3>{html.escape(seccion)}</h3>", markdown_a_html(texto)]
+    partes.append("<h2>Notas</h2>")
+    for nota, texto in NOTAS.items():
+        partes += [f"<h3>{html.escape(nota)}</h3>", markdown_a_html(texto)]
+    partes += ["</body>", "</html>"]
+    return "\n".join(partes)
+
+
+def construir_markdown(ruta):
+    """
+    Devuelve el reporte Markdown de `ruta`, con las imágenes embebidas.
+    """
+    partes = [f"# Análisis de Datos de Estudiantes — {os.path.basename(ruta)}"]
+    for subtitulo, secciones in _secciones(ruta):
+        partes.append(f"## {subtitulo}")
+        for titulo_seccion, tablas, contenido in secciones:
+            partes.append(f"### {titulo_seccion}")
+            if tablas is not None:
+                partes += [tabla_markdown(tabla) for tabla in tablas.values()]
+            else:
+                partes.append(f"![{titulo_seccion}]({_imagen_base64(contenido)})")
+
+    partes.append("## Conclusiones")
+    for seccion, texto in CONCLUSIONES.items():
+        partes += [f"### {seccion}", textwrap.dedent(texto).strip()]
+    partes.append("## Notas")
+    for nota, texto in NOTAS.items():
+        partes += [f"### {nota}", textwrap.dedent(texto).strip()]
+    return "\n\n".join(partes) + "\n"
+
+
+def exportar_reporte(ruta, formato="html", forzar=False):
+    """
+    Escribe el reporte de `ruta` si no hay uno vigente (o si `forzar`).
+    Devuelve (ruta del reporte, True si se generó).
+    """
+    destino = ruta_reporte(ruta, formato)
+    if not forzar and reporte_vigente(ruta, formato):
+        return destino, False
+
+    clave = clave_reporte(ruta, formato)
+    contenido = construir_html(ruta) if formato == "html" else construir_markdown(ruta)
+    temporal = destino + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        archivo.write(contenido)
+    os.replace(temporal, destino)
+    with open(destino + ".clave", "w") as archivo:
+        archivo.write(clave)
+    return destino, True
+
+
+def exportar_reportes(rutas, formato="html", forzar=False, trabajadores=None):
+    """
+    Genera los reportes de varios datasets en procesos trabajadores en paralelo.
+    """
+    return mapear_en_paralelo(partial(exportar_reporte, formato=formato, forzar=forzar), list(rutas), trabajadores)
+
+
+def dividir_por_comuna(ruta, directorio):
+    """
+    Escribe un CSV por comuna en `directorio` y devuelve sus rutas. Los archivos
+    sólo se reescriben si el CSV de origen cambió, para no invalidar sus reportes.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    df = None
+    rutas = []
+    for comuna in cargar_estudiantes(ruta, ["Comuna"])["Comuna"].cat.categories:
+        destino = os.path.join(directorio, comuna.replace(" ", "_") + ".csv")
+        if not derivado_vigente(destino, ruta):
+            df = cargar_estudiantes(ruta) if df is None else df
+            df[df["Comuna"] == comuna].to_csv(destino, index=False)
+        rutas.append(destino)
+    return rutas
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Genera reportes estáticos del análisis de estudiantes.")
+    parser.add_argument('origenes', nargs='*', default=[RUTA_DATOS],
+                        help="CSV, directorios o patrones glob; se genera un reporte por CSV")
+    parser.add_argument('--formato', choices=list(FORMATOS), default="html")
+    parser.add_argument('--por-comuna', metavar="DIRECTORIO",
+                        help="dividir cada CSV por comuna en DIRECTORIO y generar un reporte por comuna")
+    parser.add_argument('--forzar', action='store_true', help="regenerar aunque el reporte esté vigente")
+    parser.add_argument('--trabajadores', type=int, default=None,
+                        help="procesos trabajadores (por defecto, uno por núcleo)")
+    args = parser.parse_args(argumentos)
+
+    # Sin pantalla: las figuras se dibujan con el backend Agg
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+    rutas = [r for origen in args.origenes for r in ([origen] if os.path.isfile(origen) else listar_fragmentos(origen))]
+    if args.por_comuna:
+        rutas = [r for ruta in rutas for r in dividir_por_comuna(ruta, args.por_comuna)]
+
+    for destino, generado in exportar_reportes(rutas, args.formato, args.forzar, args.trabajadores):
+        print(f"{destino}: {'generado' if generado else 'vigente, sin cambios'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Generadores de datos sintéticos con el mismo esquema que los CSV del repositorio.
+
+Las columnas, rangos y proporciones de Genero y Comuna reproducen las de
+`datos_estudiantes_desafio.csv`; las ventas siguen el formato de
+`ventas_productos.csv`. Los archivos se escriben por bloques, por lo que se
+pueden generar decenas de millones de filas con memoria acotada.
+"""
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+# Filas generadas y escritas por bloque
+TAMANO_BLOQUE = 1_000_000
+
+# Proporciones observadas en datos_estudiantes_desafio.csv
+GENEROS = {"prefiero no decirlo": 0.3371, "femenino": 0.3345, "masculino": 0.3284}
+COMUNAS = {
+    "Arauco": 0.12855, "Tomé": 0.12795, "Coronel": 0.12780, "Hualpén": 0.12660,
+    "Concepción": 0.12440, "Penco": 0.12245, "Lota": 0.12170, "San Pedro": 0.12055,
+}
+
+# Rangos (inclusivos) de las columnas numéricas
+RANGOS = {
+    "Edad": (18, 25),
+    "Horas_de_estudio": (5, 39),
+    "Nota_Matemáticas": (1, 100),
+    "Nota_Lenguaje": (1, 100),
+    "Nota_Ciencias": (1, 100),
+}
+
+# Sin comillas, igual que los CSV originales (ningún valor contiene comas); el
+# encabezado se escribe aparte porque Arrow siempre lo entrecomilla
+OPCIONES_ESCRITURA = pacsv.WriteOptions(include_header=False, quoting_style="none")
+
+
+def _elegir(rng, proporciones, n):
+    valores = np.array(list(proporciones))
+    pesos = np.array(list(proporciones.values()))
+    return valores[rng.choice(len(valores), size=n, p=pesos / pesos.sum())]
+
+
+def _escribir_por_bloques(destino, filas, generar_bloque, tamano_bloque):
+    # Se escribe a un temporal y se reemplaza al final, como las instantáneas
+    temporal = destino + ".tmp"
+    escritor = None
+    with open(temporal, "wb") as salida:
+        for inicio in range(0, filas, tamano_bloque):
+            tabla = pa.table(generar_bloque(inicio, min(tamano_bloque, filas - inicio)))
+            if escritor is None:
+                salida.write((",".join(tabla.column_names) + "\n").encode())
+                escritor = pacsv.CSVWriter(salida, tabla.schema, write_options=OPCIONES_ESCRITURA)
+            escritor.write_table(tabla)
+        if escritor is not None:
+            escritor.close()
+    os.replace(temporal, destino)
+    return destino
+
+
+def generar_estudiantes(destino, filas, semilla=0, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Escribe en `destino` un CSV de `filas` estudiantes con el esquema de
+    `datos_estudiantes_desafio.csv` y devuelve su ruta.
+    """
+    rng = np.random.default_rng(semilla)
+
+    def bloque(inicio, n):
+        columnas = {"Estudiante_ID": np.arange(inicio + 1, inicio + n + 1, dtype=np.uint32)}
+        for columna, (minimo, maximo) in RANGOS.items():
+            columnas[columna] = rng.integers(minimo, maximo + 1, size=n, dtype=np.uint8)
+        columnas["Genero"] = _elegir(rng, GENEROS, n)
+        columnas["Comuna"] = _elegir(rng, COMUNAS, n)
+        return columnas
+
+    return _escribir_por_bloques(destino, filas, bloque, tamano_bloque)
+
+
+def generar_ventas(destino, filas, productos=100, semilla=0, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Escribe en `destino` un CSV de `filas` ventas (producto, cantidad, precio)
+    con el formato de `ventas_productos.csv` y devuelve su ruta.
+
+    Cada producto tiene un precio fijo entre 5.0 y 10.0 (en pasos de 0.5) y una
+    popularidad desigual, para que el top de productos sea estable.
+    """
+    rng = np.random.default_rng(semilla)
+    nombres = np.array([f"Producto{i}" for i in range(1, productos + 1)])
+    precios = rng.integers(10, 21, size=productos) / 2
+    popularidad = 1 / np.arange(1, productos + 1)
+    popularidad /= popularidad.sum()
+
+    def bloque(inicio, n):
+        indices = rng.choice(productos, size=n, p=popularidad)
+        return {
+            "producto": nombres[indices],
+            "cantidad": rng.integers(1, 51, size=n),
+            "precio": precios[indices],
+        }
+
+    return _escribir_por_bloques(destino, filas, bloque, tamano_bloque)
@@ -0,0 +1,199 @@
+"""
+Instantáneas columnares (Arrow IPC) de los archivos CSV.
+
+La primera lectura convierte el CSV a un archivo ``.arrow`` tipado junto al original.
+Las lecturas siguientes mapean ese archivo en memoria y cargan sólo las columnas
+pedidas, sin volver a interpretar texto. La instantánea se regenera únicamente
+cuando el CSV es más reciente que ella.
+
+Cada escritura usa un temporal propio en el mismo directorio y lo reemplaza de
+forma atómica, de modo que varias sesiones (o la app y la línea de comandos) pueden
+regenerar el mismo archivo a la vez. Dentro de un proceso, la regeneración de cada
+instantánea se serializa para no convertir el mismo CSV varias veces.
+
+Uso como paso de ingesta:
+
+    python -m analitica.snapshot desafio_analisis_estudiantes/data/datos_estudiantes_desafio.csv
+"""
+import os
+import sys
+import tempfile
+import threading
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+from analitica.cache import cache_datasets
+
+EXTENSION = ".arrow"
+
+# Un lock por instantánea, para que sólo una sesión la regenere
+_locks = {}
+_lock_locks = threading.Lock()
+
+
+def _lock_destino(destino):
+    with _lock_locks:
+        return _locks.setdefault(os.path.abspath(destino), threading.Lock())
+
+
+def _temporal(destino):
+    # Temporal único junto al destino, para que os.replace no cruce sistemas de archivos
+    descriptor, temporal = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(destino)), prefix=os.path.basename(destino) + ".", suffix=".tmp",
+    )
+    os.close(descriptor)
+    return temporal
+
+
+def ruta_snapshot(ruta_csv):
+    """
+    Devuelve la ruta de la instantánea asociada a un CSV.
+    """
+    return os.path.splitext(ruta_csv)[0] + EXTENSION
+
+
+def derivado_vigente(ruta_derivada, ruta_csv):
+    """
+    Indica si un archivo derivado de un CSV existe y es al menos tan reciente como él.
+    """
+    if not os.path.exists(ruta_derivada):
+        return False
+    return os.stat(ruta_derivada).st_mtime_ns >= os.stat(ruta_csv).st_mtime_ns
+
+
+def snapshot_vigente(ruta_csv, tipos=None):
+    """
+    Indica si la instantánea existe, es al menos tan reciente como el CSV y sus
+    columnas tienen los tipos pedidos.
+    """
+    destino = ruta_snapshot(ruta_csv)
+    if not derivado_vigente(destino, ruta_csv):
+        return False
+    if tipos:
+        # Leer el esquema sólo toca el pie del archivo
+        esquema = pa.ipc.open_file(pa.memory_map(destino, "r")).schema
+        for columna, tipo in tipos.items():
+            if esquema.get_field_index(columna) < 0 or esquema.field(columna).type != tipo:
+                return False
+    return True
+
+
+def convertir_csv(ruta_csv, tipos=None):
+    """
+    Convierte un CSV a Arrow IPC leyendo por lotes, con memoria acotada.
+
+    `tipos` permite fijar el tipo Arrow de algunas columnas ({columna: tipo}).
+    Si un valor no cabe en el tipo declarado se lanza ValueError.
+    Devuelve la ruta de la instantánea escrita.
+    """
+    destino = ruta_snapshot(ruta_csv)
+    opciones = pacsv.ConvertOptions(column_types=tipos or {})
+
+    temporal = _temporal(destino)
+    try:
+        lector = pacsv.open_csv(ruta_csv, convert_options=opciones)
+        with pa.OSFile(temporal, "wb") as salida:
+            with pa.ipc.new_file(salida, lector.schema) as escritor:
+                for lote in lector:
+                    escritor.write_batch(lote)
+        # Reemplazo atómico para que ningún lector vea un archivo a medio escribir
+        os.replace(temporal, destino)
+    except pa.ArrowInvalid as error:
+        raise ValueError(f"El archivo {ruta_csv} no cumple el esquema declarado: {error}") from error
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    return destino
+
+
+def asegurar_snapshot(ruta_csv, tipos=None):
+    """
+    Devuelve la ruta de una instantánea vigente, regenerándola si el CSV cambió.
+    """
+    destino = ruta_snapshot(ruta_csv)
+    if snapshot_vigente(ruta_csv, tipos):
+        return destino
+    with _lock_destino(destino):
+        # Otra sesión pudo regenerarla mientras se esperaba el lock
+        if not snapshot_vigente(ruta_csv, tipos):
+            convertir_csv(ruta_csv, tipos)
+    return destino
+
+
+def leer_tabla(ruta_csv, columnas=None, tipos=None, categoricas=()):
+    """
+    Lee una instantánea como tabla Arrow mapeada en memoria.
+
+    Sólo se materializan las columnas pedidas; el resto del archivo no se toca.
+    Las columnas de texto listadas en `categoricas` se codifican como diccionario,
+    lo que al pasar a pandas produce columnas de tipo `category`.
+    """
+    origen = pa.memory_map(asegurar_snapshot(ruta_csv, tipos), "r")
+    tabla = pa.ipc.open_file(origen).read_all()
+    if columnas is not None:
+        tabla = tabla.select(list(columnas))
+    for columna in categoricas:
+        indice = tabla.schema.get_field_index(columna)
+        if indice >= 0:
+            tabla = tabla.set_column(indice, columna, pc.dictionary_encode(tabla.column(columna)))
+    return tabla
+
+
+def escribir_arrow(df, ruta, metadatos=None):
+    """
+    Guarda un DataFrame (sin su índice) como Arrow IPC, con metadatos de texto
+    opcionales. La escritura es atómica.
+    """
+    tabla = pa.Table.from_pandas(df, preserve_index=False)
+    metadatos = {clave.encode(): str(valor).encode() for clave, valor in (metadatos or {}).items()}
+    tabla = tabla.replace_schema_metadata(metadatos)
+    temporal = _temporal(ruta)
+    try:
+        with pa.OSFile(temporal, "wb") as salida:
+            with pa.ipc.new_file(salida, tabla.schema) as escritor:
+                escritor.write_table(tabla)
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+
+
+def leer_arrow(ruta):
+    """
+    Lee un archivo escrito con `escribir_arrow` y devuelve (DataFrame, metadatos).
+    """
+    with pa.memory_map(ruta, "r") as origen:
+        tabla = pa.ipc.open_file(origen).read_all()
+    metadatos = {clave.decode(): valor.decode() for clave, valor in (tabla.schema.metadata or {}).items()}
+    return tabla.to_pandas(), metadatos
+
+
+def tabla_a_pandas(tabla, categoricas=()):
+    """
+    Convierte una tabla Arrow a DataFrame con las categorías ordenadas
+    alfabéticamente, como las ordenaría un groupby sobre texto.
+    """
+    df = tabla.to_pandas()
+    for columna in categoricas:
+        if columna in df.columns:
+            df[columna] = df[columna].cat.reorder_categories(sorted(df[columna].cat.categories))
+    return df
+
+
+def leer_columnas(ruta_csv, columnas=None, tipos=None, categoricas=()):
+    """
+    Devuelve un DataFrame con las columnas pedidas, cacheado por versión del CSV.
+    """
+    variante = ("snapshot", tuple(columnas) if columnas is not None else None)
+    return cache_datasets.obtener(
+        ruta_csv,
+        lambda ruta: tabla_a_pandas(leer_tabla(ruta, columnas, tipos, categoricas), categoricas),
+        variante=variante,
+    )
+
+
+if __name__ == "__main__":
+    for ruta in sys.argv[1:]:
+        print(convertir_csv(ruta))
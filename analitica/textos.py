@@ -0,0 +1,155 @@
+"""
+Conclusiones y notas del análisis de estudiantes, compartidas por la app y los
+reportes estáticos. El texto está en Markdown.
+"""
+
+# Conclusiones intermedias por sección y conclusión general
+CONCLUSIONES = {
+    "Exploración de datos": """
+        1. **Carga de Datos y Exploración Inicial:**
+            - Los datos de los estudiantes fueron cargados exitosamente, y al mostrar las primeras y últimas filas del DataFrame, se confirmó que la estructura general de los datos está completa y organizada.
+            - La revisión inicial permitió entender cómo están estructurados los datos, como columnas y tipos de variables.
+
+        2. **Dimensionalidad del DataFrame:**
+            - El uso de `.shape` confirmó la cantidad de filas y columnas, lo que ofrece una visión general del tamaño del conjunto de datos y su nivel de complejidad.
+
+        3. **Resumen Estadístico:**
+            - La utilización de `.describe()` permitió identificar medidas clave como promedio, desviación estándar, valores mínimos y máximos para las columnas numéricas. Esto ayuda a tener una visión clara de la distribución de los datos y detectar posibles valores atípicos.
+
+        4. **Verificación de Calidad de los Datos:**
+            - Mediante `.info()`, se comprobó la ausencia de valores nulos y se validó el tipo de datos en cada columna, asegurando que no será necesario realizar imputaciones de valores faltantes.
+    """,
+    "Limpieza de Datos": """
+        Durante la etapa de **verificación y manejo de valores nulos**, se evaluaron los datos en busca de valores faltantes en cada columna. Al calcular el porcentaje de datos nulos, se determinó que **todas las columnas tienen un 0% de datos faltantes**.  
+
+        Como resultado, no fue necesario realizar imputaciones o reemplazos, ya que el conjunto de datos está completamente limpio en este aspecto. Esta verificación garantiza que el análisis posterior no estará afectado por valores ausentes.
+    """,
+    "Análisis Exploratorio": """
+    - **Promedio por Asignatura**:  
+        - Matemáticas: **50.84%**  
+        - Lenguaje: **50.47%**  
+        - Ciencias: **50.59%**  
+    Las calificaciones están balanceadas alrededor de 50% en promedio, lo que sugiere una distribución relativamente uniforme en las tres asignaturas.  
+    - **Porcentaje de Estudiantes con Calificaciones ≥ 60**:  
+        - Matemáticas: **41.30%**  
+        - Lenguaje: **41.09%**  
+        - Ciencias: **41.22%**  
+        Aproximadamente el 41% de los estudiantes lograron calificaciones destacadas (≥ 60) en cada asignatura.  
+
+    - **Comuna con Mejor Promedio en Matemáticas**:  
+        - La comuna de **Tomé** obtuvo el promedio más alto en Matemáticas con **51.60%**, ligeramente superior al promedio general. 
+    """,
+    "Filtros y Agrupaciones": """
+    - **Estudiantes con Calificaciones Promedio Mayores a 80**:  
+        - Se identificaron **708 estudiantes** con un promedio de calificaciones superior a 80.  
+        - Ejemplo de los primeros 5 estudiantes:
+            - Estudiante 36: **84.33**  
+            - Estudiante 81: **84.00**  
+            - Estudiante 84: **83.33**  
+            - Estudiante 86: **83.00**  
+            - Estudiante 105: **84.67**  
+
+    - **Promedio de Calificaciones por Género**:  
+        - **Femenino**:  
+            - Matemáticas: **51.05**  
+            - Lenguaje: **50.58**  
+            - Ciencias: **50.30**  
+        - **Masculino**:  
+            - Matemáticas: **50.71**  
+            - Lenguaje: **50.36**  
+            - Ciencias: **50.32**  
+        - **Prefiero no decirlo**:  
+            - Matemáticas: **50.76**  
+            - Lenguaje: **50.46**  
+            - Ciencias: **51.15**  
+
+    Las diferencias en promedios por género son mínimas, pero destacan ligeramente las calificaciones de estudiantes que prefirieron no declarar su género en Ciencias (**51.15**).
+    """,
+    "Preprocesamiento de Datos":"""
+    ##### 1. **Normalización de las Calificaciones y Horas de Estudio**  
+        - Se aplicó **StandardScaler** para normalizar las columnas de calificaciones y horas de estudio.  
+        - Después de la normalización:  
+        - **Promedio (mean):** Cercano a 0 para todas las columnas normalizadas.  
+        - **Desviación estándar (std):** Igual a 1, lo que confirma que los datos fueron escalados correctamente.  
+        - **Rango de los datos:**  
+            - Mínimo: Aproximadamente **-1.73**.  
+            - Máximo: Aproximadamente **1.71**.  
+    
+        Esta normalización asegura que todas las variables tengan el mismo peso en análisis y modelos posteriores.  
+    
+    ##### 2. **Codificación de la Columna "Genero"**  
+        - Se utilizó **One-Hot Encoding** para convertir la columna categórica `"Genero"` en variables binarias.  
+        - Nuevas columnas generadas:  
+        - `Genero_femenino`  
+        - `Genero_masculino`  
+        - `Genero_prefiero no decirlo`  
+        - Ejemplo de datos procesados:  
+        - El género de cada estudiante ahora está representado con valores booleanos (`True` o `False`) en las columnas correspondientes.  
+    
+    #### Resumen  
+        - Las variables normalizadas están listas para su uso en modelos de machine learning o análisis estadísticos.  
+        - La codificación de `"Genero"` asegura que los datos categóricos sean compatibles con modelos que requieren valores numéricos.
+    """,
+    "Visualizaciones": """
+    ##### 1. **Distribución de Calificaciones por Asignatura (Primer Gráfico)**
+    - Los histogramas de las calificaciones en **Matemáticas**, **Lenguaje** y **Ciencias** muestran una **distribución uniforme**.
+        - Esto sugiere que las calificaciones están equilibradas y no hay asignaturas con tendencias de calificaciones más altas o más bajas.
+        - La distribución uniforme indica que no hay asignaturas que se perciban significativamente más fáciles o más difíciles entre los estudiantes.
+
+    ##### 2. **Promedio de Calificaciones por Comuna (Segundo Gráfico)**
+    - El gráfico de barras proporciona un análisis de los **promedios de calificaciones por comuna**.
+        - Permite identificar si alguna comuna tiene un desempeño sobresaliente o deficiente en alguna asignatura.
+        - Esto podría reflejar posibles diferencias en **calidad educativa** o **acceso a recursos** en distintas comunas, lo que sugiere áreas para mejorar o investigar.
+
+    ##### 3. **Relación entre Horas de Estudio y Promedio (Tercer Gráfico)**
+    - El gráfico de dispersión muestra una clara **relación positiva** entre las **horas de estudio** y el **promedio de calificaciones**.
+        - A medida que aumentan las horas dedicadas al estudio, los estudiantes tienden a tener un **mejor desempeño académico**.
+        - Esta evidencia respalda la importancia del tiempo invertido en el estudio para mejorar los resultados.
+
+    #### **Relación entre los Gráficos**
+    - **Distribución de Calificaciones y Promedio por Comuna**:  
+        - La distribución uniforme de calificaciones ayuda a interpretar los promedios de calificaciones por comuna de manera objetiva, sin sesgos evidentes en las calificaciones.
+
+    - **Promedios de Calificaciones y Horas de Estudio**:  
+        - Si algunas comunas presentan promedios bajos en el gráfico de barras, podría ser útil investigar si en esas comunas los estudiantes dedican menos tiempo al estudio, como sugiere la tendencia positiva del gráfico de dispersión.
+
+    #### **Resumen**
+    - Los tres gráficos proporcionan una visión integral de cómo la distribución de las calificaciones, la ubicación geográfica (comunas) y las horas de estudio influyen en el desempeño académico de los estudiantes.
+    - A través de este análisis, se pueden identificar áreas de mejora tanto en términos de distribución de recursos como en la optimización del tiempo de estudio. 
+    """,
+    "Conclusión General": """
+    El análisis del desempeño académico de los estudiantes ha proporcionado valiosas perspectivas sobre diversos factores que afectan los resultados educativos:
+
+    1. **Calificaciones y Distribución**:  
+       Las calificaciones en Matemáticas, Lenguaje y Ciencias presentan una distribución **uniforme**, lo que sugiere que no existen asignaturas significativamente más fáciles ni más difíciles. Esto refleja una estabilidad general en el desempeño de los estudiantes en estas áreas.
+
+    2. **Impacto de las Comunas**:  
+       El análisis de los promedios por comuna revela diferencias significativas en el desempeño académico, lo que podría estar relacionado con factores como la **calidad educativa** y el **acceso a recursos**. La comuna de **Tomé** se destacó con el promedio más alto en Matemáticas, lo que invita a explorar qué condiciones en esa comuna podrían estar favoreciendo el rendimiento.
+
+    3. **Relación con las Horas de Estudio**:  
+       Se encontró una **relación positiva** entre las horas de estudio y el promedio de calificaciones. Esto confirma que un mayor tiempo dedicado al estudio tiene un impacto directo en el desempeño académico, lo que resalta la importancia de la dedicación personal para mejorar los resultados.
+
+    4. **Filtrado y Análisis por Género**:  
+       Aunque las diferencias en los promedios por género son mínimas, se observó un ligero **mejor desempeño en Ciencias** entre aquellos estudiantes que prefirieron no declarar su género. Estos resultados subrayan la importancia de considerar diversas variables en el análisis de desempeño académico.
+
+    5. **Preprocesamiento de Datos y Transformaciones**:  
+       La **normalización** de las calificaciones y las **horas de estudio**, junto con la **codificación de la columna de género**, permitió preparar los datos para análisis posteriores, garantizando que las variables estén escaladas adecuadamente y que la información categórica sea manejada de manera efectiva en modelos predictivos.
+
+    6. **Conclusiones Gráficas**:  
+       Los gráficos proporcionaron una visión clara sobre cómo las distribuciones de calificaciones, los promedios por comuna y las horas de estudio se relacionan con el desempeño académico. Los resultados sugieren que, al analizar estos factores en conjunto, es posible identificar áreas para **mejorar la distribución de recursos** y optimizar **estrategias de estudio** a nivel individual y regional.
+
+    En conjunto, estos análisis ofrecen una visión integral sobre cómo **el esfuerzo individual**, **los factores geográficos** y **el acceso a recursos educativos** pueden influir significativamente en el desempeño académico. Este enfoque puede ser útil para diseñar **políticas educativas** más equitativas y enfocadas en las necesidades específicas de los estudiantes.
+    """
+}
+
+
+# Notas sobre el desarrollo del análisis
+NOTAS = {
+    "Nota 1": """
+    **Se cambió la pregunta inicial: "¿Qué patrón observas entre horas de estudio y desempeño en matemáticas?"** por **"¿Qué patrón observas entre horas de estudio y el promedio de calificaciones?"**. 
+    Esto se hizo porque la relación entre horas de estudio y el desempeño específicamente en matemáticas no proporcionaba un patrón claro o no permitía hacer inferencias significativas. Al ampliar el análisis al promedio general de calificaciones, se pudo observar una relación más evidente y relevante entre las horas de estudio y el rendimiento académico.
+    """,
+    "Nota 2": """
+    Aunque este ejemplo fue práctico y sencillo, faltaron algunos elementos que podrían haber añadido más complejidad al análisis. Por ejemplo, no se incluyeron datos nulos ni duplicados, lo que hubiera permitido realizar un manejo más exhaustivo de los datos. Además, la normalización fue bastante directa, pero para futuras iteraciones, sería beneficioso contar con un conjunto de datos más diverso y desordenado. La inclusión de valores nulos, variables categóricas adicionales o incluso datos más desbalanceados podría generar un análisis más desafiante, permitiendo aplicar técnicas más complejas de limpieza y preprocesamiento. De igual manera, la exploración de nuevas transformaciones y la manipulación de datos adicionales podría enriquecer el análisis y aportar más información relevante para los modelos posteriores.
+    """
+}
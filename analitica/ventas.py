@@ -0,0 +1,110 @@
+"""
+Agregación por bloques del registro de ventas.
+
+El CSV se lee en bloques de tamaño fijo y cada bloque se resume por producto antes
+de sumarlo al acumulado, de modo que la memoria depende de la cantidad de
+productos distintos y no del tamaño del archivo.
+"""
+import os
+from functools import partial
+
+import pandas as pd
+
+from analitica.incremental import AcumuladorIncremental
+from analitica.paralelo import mapear_en_paralelo
+from analitica.snapshot import escribir_arrow, leer_arrow
+
+# Filas por bloque al leer el CSV en modo streaming
+TAMANO_BLOQUE = 1_000_000
+
+# Columnas y tipos que se leen del CSV de ventas
+OPCIONES_LECTURA = {
+    "usecols": ["producto", "cantidad", "precio"],
+    "dtype": {"producto": "category", "cantidad": "int64", "precio": "float64"},
+}
+
+
+def resumir_bloque(bloque):
+    """
+    Resume un bloque de ventas: cantidad total e ingreso por producto.
+    """
+    bloque = bloque.assign(ingreso=bloque["cantidad"] * bloque["precio"])
+    resumen = bloque.groupby("producto", observed=True, sort=False)[["cantidad", "ingreso"]].sum()
+    # Las categorías cambian entre bloques; el índice se pasa a texto para poder sumarlos
+    resumen.index = resumen.index.astype(str)
+    return resumen
+
+
+def acumular_ventas(ruta, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Recorre el CSV por bloques y devuelve el resumen por producto, ordenado por
+    ingreso descendente.
+    """
+    acumulado = None
+    bloques = pd.read_csv(ruta, chunksize=tamano_bloque, **OPCIONES_LECTURA)
+    for bloque in bloques:
+        resumen = resumir_bloque(bloque)
+        acumulado = resumen if acumulado is None else acumulado.add(resumen, fill_value=0)
+
+    if acumulado is None:
+        return pd.DataFrame(columns=["cantidad", "ingreso"], index=pd.Index([], name="producto"))
+    # Al alinear bloques con productos distintos las sumas pasan a float
+    acumulado["cantidad"] = acumulado["cantidad"].astype("int64")
+    return acumulado.sort_values("ingreso", ascending=False)
+
+
+def combinar_ventas(resumenes):
+    """
+    Suma los resúmenes por producto de varios fragmentos.
+    """
+    combinado = pd.concat(resumenes).groupby(level=0).sum()
+    return combinado.sort_values("ingreso", ascending=False)
+
+
+def acumular_ventas_fragmentos(rutas, tamano_bloque=TAMANO_BLOQUE, trabajadores=None):
+    """
+    Resume cada fragmento en un proceso trabajador y combina los resultados.
+    """
+    resumenes = mapear_en_paralelo(partial(acumular_ventas, tamano_bloque=tamano_bloque), rutas, trabajadores)
+    return combinar_ventas(resumenes)
+
+
+def _guardar_resumen(resumen, ruta, metadatos):
+    escribir_arrow(resumen.reset_index(), ruta, metadatos)
+
+
+def _leer_resumen(ruta):
+    tabla, metadatos = leer_arrow(ruta)
+    return tabla.set_index("producto"), metadatos
+
+
+def acumulador_ventas(ruta, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Acumulador incremental del resumen por producto de un CSV de ventas.
+
+    El estado se guarda junto al CSV (``.ventas.arrow``); en cada ejecución sólo se
+    interpretan las filas agregadas desde la anterior.
+    """
+    return AcumuladorIncremental(
+        ruta,
+        resumir_bloque,
+        lambda resumen, otro: combinar_ventas([resumen, otro]),
+        opciones_lectura=OPCIONES_LECTURA,
+        ruta_estado=os.path.splitext(ruta)[0] + ".ventas.arrow",
+        guardar=_guardar_resumen,
+        leer=_leer_resumen,
+        tamano_bloque=tamano_bloque,
+    )
+
+
+def top_productos(resumen, n=10, etiqueta_otros="Otros"):
+    """
+    Conserva los `n` productos con mayor ingreso y agrupa el resto en una fila
+    `etiqueta_otros`.
+    """
+    resumen = resumen.sort_values("ingreso", ascending=False)
+    if len(resumen) <= n:
+        return resumen
+    top = resumen.iloc[:n]
+    otros = resumen.iloc[n:].sum().to_frame(etiqueta_otros).T.astype(resumen.dtypes)
+    return pd.concat([top, otros])
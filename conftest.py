@@ -0,0 +1 @@
+# Permite importar el paquete `analitica` desde los tests sin instalarlo
@@ -1,19 +1,91 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+import argparse
+import sys
+from pathlib import Path
 
-# Cargar los datos desde el CSV
-df = pd.read_csv('ventas_productos.csv')
+# Permite importar el paquete compartido `analitica` desde la raíz del repositorio
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-# Calcular el precio total por producto
-df['precio_total'] = df['cantidad'] * df['precio']
+from analitica.figuras import guardar_figura
+from analitica.paralelo import listar_fragmentos
+from analitica.snapshot import leer_columnas
+from analitica.ventas import (
+    TAMANO_BLOQUE, acumulador_ventas, acumular_ventas, acumular_ventas_fragmentos, top_productos,
+)
 
-# Crear un gráfico de barras
-plt.figure(figsize=(10, 6))
-plt.bar(df['producto'], df['precio_total'], color='skyblue')
-plt.xlabel('Producto')
-plt.ylabel('Precio Total')
-plt.title('Precio Total por Producto')
 
-# Guardar el gráfico como una imagen PNG
-plt.savefig('grafico_precio_total.png')
-plt.show()
\ No newline at end of file
+def dibujar_precio_total(ruta):
+    import matplotlib.pyplot as plt
+
+    # Cargar los datos desde la instantánea columnar del CSV (se regenera si el CSV cambia)
+    df = leer_columnas(ruta, ['producto', 'cantidad', 'precio'])
+
+    # Calcular el precio total por producto
+    precio_total = df['cantidad'] * df['precio']
+
+    # Crear un gráfico de barras
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.bar(df['producto'], precio_total, color='skyblue')
+    ax.set_xlabel('Producto')
+    ax.set_ylabel('Precio Total')
+    ax.set_title('Precio Total por Producto')
+    return fig
+
+
+def dibujar_precio_total_streaming(ruta, top, tamano_bloque=TAMANO_BLOQUE, trabajadores=None, incremental=False):
+    import matplotlib.pyplot as plt
+
+    # Leer el CSV por bloques y acumular cantidad e ingreso por producto;
+    # con varios fragmentos cada uno se procesa en un proceso trabajador y en modo
+    # incremental sólo se leen las filas agregadas desde la ejecución anterior
+    if isinstance(ruta, list):
+        resumen = acumular_ventas_fragmentos(ruta, tamano_bloque, trabajadores)
+    elif incremental:
+        resumen = acumulador_ventas(ruta, tamano_bloque).actualizar()
+    else:
+        resumen = acumular_ventas(ruta, tamano_bloque)
+    resumen = top_productos(resumen, top)
+
+    # Crear un gráfico de barras con los productos principales y el resto agrupado
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.bar(resumen.index, resumen['ingreso'], color='skyblue')
+    ax.set_xlabel('Producto')
+    ax.set_ylabel('Precio Total')
+    ax.set_title(f'Precio Total por Producto (top {top} y otros)')
+    ax.tick_params(axis='x', rotation=45)
+    return fig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gráfico del precio total por producto.")
+    parser.add_argument('--streaming', action='store_true',
+                        help="leer el CSV por bloques y agregar por producto (memoria constante)")
+    parser.add_argument('--bloque', type=int, default=TAMANO_BLOQUE, help="filas por bloque en modo streaming")
+    parser.add_argument('--top', type=int, default=10, help="productos a mostrar en modo streaming")
+    parser.add_argument('--fragmentos',
+                        help="directorio o patrón glob con varios CSV de ventas (implica --streaming)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="procesar sólo las filas agregadas al CSV desde la última ejecución (implica --streaming)")
+    parser.add_argument('--trabajadores', type=int, default=None,
+                        help="procesos trabajadores para los fragmentos (por defecto, uno por núcleo)")
+    args = parser.parse_args()
+
+    ruta = listar_fragmentos(args.fragmentos) if args.fragmentos else 'ventas_productos.csv'
+
+    # Guardar el gráfico como una imagen PNG (sólo se vuelve a dibujar si los datos cambiaron)
+    if args.streaming or args.fragmentos or args.incremental:
+        dibujado = guardar_figura(
+            ruta, 'grafico_precio_total.png', 'precio_total_streaming',
+            lambda r, top: dibujar_precio_total_streaming(r, top, args.bloque, args.trabajadores, args.incremental),
+            top=args.top,
+        )
+    else:
+        dibujado = guardar_figura(ruta, 'grafico_precio_total.png', 'precio_total', dibujar_precio_total)
+
+    if dibujado:
+        print("Gráfico guardado en grafico_precio_total.png")
+    else:
+        print("Los datos no cambiaron; se conserva grafico_precio_total.png")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import functools
+
+import numpy as np
+import pandas as pd
+
+from analitica.bosquejos import BosquejoCuantiles, BosquejoFrecuencias, ResumenAproximado
+
+CUANTILES = np.linspace(0.01, 0.99, 99)
+SEMILLAS = range(10)
+
+
+def _errores_de_rango(bosquejo, valores):
+    # Distancia entre cada q pedido y el intervalo de rangos normalizados reales de su estimación
+    ordenados = np.sort(valores)
+    estimados = bosquejo.cuantiles(CUANTILES)
+    menor = np.searchsorted(ordenados, estimados, side="left") / len(valores)
+    mayor = np.searchsorted(ordenados, estimados, side="right") / len(valores)
+    return np.maximum(0, np.maximum(menor - CUANTILES, CUANTILES - mayor))
+
+
+def _comprobar_error_de_rango(bosquejos, valores):
+    # `error_rango` tiene 99 % de confianza por cuantil: a lo sumo 1 % de las
+    # consultas puede excederlo, y ninguna por mucho
+    errores = np.concatenate([_errores_de_rango(b, valores) for b in bosquejos])
+    error_rango = bosquejos[0].error_rango
+    assert (errores > error_rango).mean() <= 0.01
+    assert errores.max() <= 2 * error_rango
+
+
+def _fragmentos(valores, partes):
+    return np.array_split(valores, partes)
+
+
+def test_cuantiles_dentro_del_error_de_rango():
+    valores = np.random.default_rng(0).lognormal(3, 1, 200_000)
+    _comprobar_error_de_rango([BosquejoCuantiles(semilla=s).actualizar(valores) for s in SEMILLAS], valores)
+
+
+def test_cuantiles_combinados_dentro_del_error_de_rango():
+    valores = np.random.default_rng(0).lognormal(3, 1, 200_000)
+    combinados = []
+    for s in SEMILLAS:
+        bosquejos = [BosquejoCuantiles(semilla=10 * s + i).actualizar(f) for i, f in enumerate(_fragmentos(valores, 7))]
+        combinados.append(functools.reduce(BosquejoCuantiles.combinar, bosquejos))
+    assert all(c.n == len(valores) for c in combinados)
+    _comprobar_error_de_rango(combinados, valores)
+
+
+def test_frecuencias_acotadas_por_el_error():
+    # Distribución sesgada con muchos valores raros, para que se apliquen descuentos
+    rng = np.random.default_rng(0)
+    valores = np.concatenate([rng.zipf(1.5, 100_000) % 5_000, rng.integers(0, 20, 20_000)])
+    bosquejos = [BosquejoFrecuencias(k=50).actualizar(f) for f in _fragmentos(valores, 5)]
+    combinado = functools.reduce(BosquejoFrecuencias.combinar, bosquejos)
+    assert combinado.error > 0
+    assert combinado.error <= len(valores) / (combinado.k + 1)
+
+    reales = pd.Series(valores).value_counts()
+    estimados = combinado.frecuentes()
+    reales_estimados = reales[estimados.index]
+    assert (estimados["count"] <= reales_estimados).all()
+    assert (estimados["cota superior"] >= reales_estimados).all()
+    # Los valores que quedaron fuera del resumen también respetan la cota
+    assert (reales.drop(estimados.index) <= combinado.error).all()
+
+
+def test_describir_coincide_con_describe():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "Nota": rng.integers(1, 101, 100_000).astype(np.uint8),
+        # Media grande y varianza pequeña: la varianza no debe perder precisión
+        "Medida": rng.normal(1e6, 1, 100_000),
+    })
+    bloques = [ResumenAproximado.desde_bloque(df.iloc[i:i + 15_000], ["Nota", "Medida"]) for i in range(0, len(df), 15_000)]
+    resumen = functools.reduce(ResumenAproximado.combinar, bloques).describir()
+    esperado = df.describe()
+
+    for estadistico in ["count", "min", "max"]:
+        assert resumen.loc[estadistico].tolist() == esperado.loc[estadistico].tolist()
+    for estadistico in ["mean", "std"]:
+        np.testing.assert_allclose(resumen.loc[estadistico], esperado.loc[estadistico], rtol=1e-12, atol=0)
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from analitica.calculos import calcular_one_hot, exportar_one_hot, medir_importacion
+from analitica.sinteticos import generar_estudiantes
+
+# Presupuesto holgado: el objetivo es detectar regresiones groseras, no medir finamente
+PRESUPUESTO_IMPORTACION = 5.0
+
+
+def test_importar_calculos_no_carga_modulos_pesados():
+    importacion = medir_importacion()
+    assert importacion["modulos_pesados"] == []
+    assert importacion["segundos"] < PRESUPUESTO_IMPORTACION
+
+
+def _estudiantes(tmp_path, filas=1_000):
+    return generar_estudiantes(str(tmp_path / "estudiantes.csv"), filas, semilla=0)
+
+
+def test_one_hot_de_las_filas_mostradas(tmp_path):
+    ruta = _estudiantes(tmp_path)
+    df = pd.read_csv(ruta)
+    primeras_filas, codigos_comuna = calcular_one_hot(ruta)
+
+    esperado = pd.concat([df.head(), pd.get_dummies(df["Genero"], prefix="Genero").head()], axis=1)
+    pd.testing.assert_frame_equal(primeras_filas, esperado, check_dtype=False)
+    assert codigos_comuna.to_dict() == {comuna: i for i, comuna in enumerate(sorted(df["Comuna"].unique()))}
+
+
+def test_exportar_one_hot_por_bloques_y_empaquetado(tmp_path):
+    ruta = _estudiantes(tmp_path)
+    esperado = pd.get_dummies(pd.read_csv(ruta)["Genero"], prefix="Genero")
+
+    exportar_one_hot(ruta, str(tmp_path / "genero.parquet"))
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "genero.parquet"), esperado)
+
+    exportar_one_hot(ruta, str(tmp_path / "genero.npz"))
+    with np.load(tmp_path / "genero.npz") as archivo:
+        bits = np.unpackbits(archivo["bits"], axis=1, count=int(archivo["filas"])).astype(bool)
+        categorias = list(archivo["categorias"])
+    assert categorias == [c.removeprefix("Genero_") for c in esperado.columns]
+    assert (bits.T == esperado.to_numpy()).all()
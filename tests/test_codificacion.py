@@ -0,0 +1,14 @@
+import numpy as np
+import pandas as pd
+
+from analitica.codificacion import OneHotCategorico
+
+
+def test_empaquetada_coincide_con_get_dummies():
+    serie = pd.Series(list("abcab" * 7) + ["c"], dtype="category", name="letra")
+    empaquetada = OneHotCategorico(serie).empaquetada()
+
+    assert empaquetada.dtype == np.uint8
+    assert empaquetada.shape == (3, 5)
+    densa = np.unpackbits(empaquetada, axis=1, count=len(serie)).astype(bool)
+    assert (densa.T == pd.get_dummies(serie).to_numpy()).all()
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from analitica.estudiantes import COLUMNAS_INDICE, NOTAS, TIPOS_ARROW, obtener_indice
+from analitica.explorador import ExploradorPaginado
+from analitica.sinteticos import generar_estudiantes
+
+
+def test_el_indice_solo_se_pide_al_ordenar_o_al_mostrar_el_promedio(tmp_path):
+    ruta = generar_estudiantes(str(tmp_path / "estudiantes.csv"), 2_000, semilla=0)
+    pedidos = []
+
+    def indice():
+        pedidos.append(1)
+        return obtener_indice(ruta)
+
+    explorador = ExploradorPaginado(ruta, TIPOS_ARROW, indice, COLUMNAS_INDICE)
+    df = pd.read_csv(ruta)
+
+    pagina = explorador.pagina(2, 25)
+    assert pedidos == []
+    assert pagina["Estudiante_ID"].tolist() == df["Estudiante_ID"][50:75].tolist()
+
+    pagina = explorador.pagina(0, 10, ["Estudiante_ID", "Promedio"])
+    assert len(pedidos) == 1
+    assert pagina["Promedio"].tolist() == df[NOTAS][:10].mean(axis=1).tolist()
+
+    pagina = explorador.pagina(0, 10, ["Edad"], orden="Edad", descendente=True)
+    assert len(pedidos) == 2
+    assert (pagina["Edad"] == df["Edad"].max()).all()
@@ -0,0 +1,73 @@
+import os
+
+from analitica import estudiantes
+from analitica.cache import cache_datasets
+from analitica.estudiantes import obtener_cubo
+from analitica.sinteticos import generar_estudiantes
+
+
+def _reiniciar():
+    # Simula un proceso nuevo: sin caché en memoria ni acumuladores, sólo el estado persistido
+    cache_datasets.limpiar()
+    estudiantes._acumuladores.clear()
+
+
+def _cambiar_edad_en_el_medio(ruta):
+    with open(ruta, "rb") as archivo:
+        lineas = archivo.read().split(b"\n")
+    medio = len(lineas) // 2
+    campos = lineas[medio].split(b",")
+    edad = campos[1]
+    campos[1] = b"18" if edad != b"18" else b"25"
+    lineas[medio] = b",".join(campos)
+    estado = os.stat(ruta)
+    with open(ruta, "wb") as archivo:
+        archivo.write(b"\n".join(lineas))
+    # Fecha de modificación claramente distinta aunque el reloj tenga poca resolución
+    os.utime(ruta, ns=(estado.st_atime_ns, estado.st_mtime_ns + 10**9))
+    assert os.stat(ruta).st_size == estado.st_size
+    return int(edad), int(campos[1])
+
+
+def test_reescritura_con_el_mismo_tamano_reconstruye_el_cubo(tmp_path):
+    ruta = str(tmp_path / "estudiantes.csv")
+    generar_estudiantes(ruta, 20_000, semilla=1)
+    antes = obtener_cubo(ruta).conteo("Edad")
+
+    edad_anterior, edad_nueva = _cambiar_edad_en_el_medio(ruta)
+    despues = obtener_cubo(ruta).conteo("Edad")
+    assert despues[edad_anterior] == antes[edad_anterior] - 1
+    assert despues[edad_nueva] == antes[edad_nueva] + 1
+
+    # El estado persistido también refleja el cambio tras reiniciar
+    _reiniciar()
+    assert obtener_cubo(ruta).conteo("Edad").equals(despues)
+
+
+def test_reescritura_detectada_desde_el_estado_persistido(tmp_path):
+    ruta = str(tmp_path / "estudiantes.csv")
+    generar_estudiantes(ruta, 20_000, semilla=2)
+    antes = obtener_cubo(ruta).conteo("Edad")
+
+    _reiniciar()
+    edad_anterior, _ = _cambiar_edad_en_el_medio(ruta)
+    assert obtener_cubo(ruta).conteo("Edad")[edad_anterior] == antes[edad_anterior] - 1
+
+
+def test_ultima_linea_sin_salto_de_linea(tmp_path):
+    ruta = str(tmp_path / "estudiantes.csv")
+    generar_estudiantes(ruta, 2_000, semilla=3)
+    with open(ruta, "rb") as archivo:
+        contenido = archivo.read()
+    with open(ruta, "wb") as archivo:
+        archivo.write(contenido.rstrip(b"\n"))
+
+    filas = len(estudiantes.cargar_estudiantes(ruta))
+    assert filas == 2_000
+    assert obtener_cubo(ruta).conteo("Edad").sum() == filas
+    assert estudiantes.obtener_escalado(ruta).estadisticas["n"].min() == filas
+
+    # Al completar la línea y agregar filas, la línea final se cuenta una sola vez
+    with open(ruta, "ab") as archivo:
+        archivo.write(b"\n" + contenido.splitlines(keepends=True)[1])
+    assert obtener_cubo(ruta).conteo("Edad").sum() == filas + 1
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from analitica.indice import IndiceOrdenado
+
+
+def _datos(n=1_000, semilla=0):
+    rng = np.random.default_rng(semilla)
+    return pd.DataFrame({
+        "Nota": rng.integers(1, 101, size=n, dtype=np.uint8),
+        "Promedio": rng.uniform(1, 100, size=n),
+        "Comuna": pd.Categorical(rng.choice(["Lota", "Penco", "Tomé"], size=n)),
+    })
+
+
+def test_consultas_por_categoria_coinciden_con_pandas():
+    datos = _datos()
+    indice = IndiceOrdenado(datos, ["Nota", "Promedio"], categoricas=["Comuna"])
+    esperado = ((datos["Promedio"] > 80) & (datos["Comuna"] == "Penco")).sum()
+    assert indice.contar("Promedio", 80, incluir_minimo=False, categoria=("Comuna", "Penco")) == esperado
+    assert indice.contar("Nota", categoria=("Comuna", "Otra")) == 0
+
+
+def test_tamano_en_memoria_incluye_todo_y_no_cambia_con_las_consultas():
+    datos = _datos()
+    indice = IndiceOrdenado(datos, ["Nota", "Promedio"], categoricas=["Comuna"])
+    tamano = indice.tamano_en_memoria()
+    assert tamano > datos.memory_usage(deep=True).sum()
+
+    indice.posiciones("Nota", 50, categoria=("Comuna", "Lota"))
+    indice.posiciones("Promedio", 50, categoria=("Comuna", "Tomé"))
+    assert indice.tamano_en_memoria() == tamano
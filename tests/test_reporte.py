@@ -0,0 +1,28 @@
+from analitica.calculos import calcular_estadisticas
+from analitica.reporte import tabla_html, tabla_markdown
+from analitica.sinteticos import generar_estudiantes
+
+
+def _estadisticas(tmp_path):
+    ruta = generar_estudiantes(str(tmp_path / "estudiantes.csv"), 20_000, semilla=0)
+    return calcular_estadisticas(ruta, ["dimensiones", "describe"])
+
+
+def test_tablas_markdown_conservan_los_valores(tmp_path):
+    estadisticas = _estadisticas(tmp_path)
+
+    dimensiones = tabla_markdown(estadisticas["dimensiones"]["dimensiones"]).splitlines()
+    assert dimensiones[2:] == ["| 0 | 20000 |", "| 1 | 8 |"]
+
+    describe = tabla_markdown(estadisticas["describe"]["describe"]).splitlines()
+    assert describe[2] == "| count | 20000 | 20000 | 20000 | 20000 | 20000 | 20000 |"
+    assert describe[3].startswith("| mean | 10,000.50 | ")
+    assert describe[5] == "| min | 1 | 18 | 5 | 1 | 1 | 1 |"
+    assert describe[9] == "| max | 20000 | 25 | 39 | 100 | 100 | 100 |"
+
+
+def test_tablas_html_conservan_los_valores(tmp_path):
+    describe = tabla_html(_estadisticas(tmp_path)["describe"]["describe"])
+    assert "<td>20000</td>" in describe
+    assert "<td>10,000.50</td>" in describe
+    assert "e+" not in describe
@@ -0,0 +1,33 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from analitica.estudiantes import TIPOS_ARROW
+from analitica.sinteticos import generar_estudiantes
+from analitica.snapshot import asegurar_snapshot, convertir_csv, escribir_arrow, leer_arrow, ruta_snapshot
+
+
+def _en_paralelo(funcion, veces=4):
+    with ThreadPoolExecutor(veces) as ejecutor:
+        return [futuro.result() for futuro in [ejecutor.submit(funcion) for _ in range(veces)]]
+
+
+def test_regeneraciones_simultaneas_no_chocan(tmp_path):
+    ruta = generar_estudiantes(str(tmp_path / "estudiantes.csv"), 200_000, semilla=0)
+    destino = ruta_snapshot(ruta)
+
+    assert _en_paralelo(lambda: asegurar_snapshot(ruta, TIPOS_ARROW)) == [destino] * 4
+    # Sin el lock (como la app y la línea de comandos a la vez) tampoco chocan
+    assert _en_paralelo(lambda: convertir_csv(ruta, TIPOS_ARROW)) == [destino] * 4
+    assert sorted(os.listdir(tmp_path)) == ["estudiantes.arrow", "estudiantes.csv"]
+
+
+def test_escrituras_de_estado_simultaneas(tmp_path):
+    ruta = str(tmp_path / "estado.arrow")
+    df = pd.DataFrame({"a": range(100_000)})
+    _en_paralelo(lambda: escribir_arrow(df, ruta, {"version": 1}))
+
+    leido, metadatos = leer_arrow(ruta)
+    assert leido.equals(df) and metadatos == {"version": "1"}
+    assert os.listdir(tmp_path) == ["estado.arrow"]